@@ -0,0 +1,8 @@
+"""
+Система маркетинговых постов на базе CrewAI.
+"""
+
+from dotenv import load_dotenv
+
+# Переменные окружения из .env загружаются один раз при импорте пакета
+load_dotenv()
@@ -0,0 +1,450 @@
+"""
+Скомпилированные YAML конфигурации.
+
+Сгенерировано tools/compile_configs.py - не редактируйте вручную.
+После изменения YAML файлов запустите скрипт снова.
+"""
+
+
+# agents.yaml
+AGENTS_CONFIG = {
+    'lead_market_analyst': {
+        'role': 'Ведущий аналитик рынка\n',
+        'goal': (
+            'Проводить потрясающий анализ продуктов и конкурентов, '
+            'предоставляя глубокие инсайты для руководства маркетинговыми '
+            'стратегиями.\n'
+        ),
+        'backstory': (
+            'Как ведущий аналитик рынка в премиальной цифровой маркетинговой '
+            'компании, вы специализируетесь на анализе онлайн-бизнес '
+            'ландшафтов.\n'
+        ),
+    },
+    'chief_marketing_strategist': {
+        'role': 'Главный маркетинговый стратег\n',
+        'goal': (
+            'Синтезировать потрясающие инсайты из анализа продуктов для '
+            'формулирования невероятных маркетинговых стратегий.\n'
+        ),
+        'backstory': (
+            'Вы - главный маркетинговый стратег в ведущем цифровом '
+            'маркетинговом агентстве, известном созданием индивидуальных '
+            'стратегий, которые приводят к успеху.\n'
+        ),
+    },
+    'creative_content_creator': {
+        'role': 'Креативный создатель контента\n',
+        'goal': (
+            'Разрабатывать убедительный и инновационный контент для кампаний '
+            'в социальных сетях, с фокусом на создание высокоэффективных '
+            'рекламных копий.\n'
+        ),
+        'backstory': (
+            'Как креативный создатель контента в топовом цифровом '
+            'маркетинговом агентстве, вы преуспеваете в создании нарративов, '
+            'которые находят отклик у аудитории. Ваша экспертиза заключается '
+            'в превращении маркетинговых стратегий в увлекательные истории и '
+            'визуальный контент, который привлекает внимание и вдохновляет на '
+            'действия.\n'
+        ),
+    },
+    'chief_creative_director': {
+        'role': 'Главный креативный директор\n',
+        'goal': (
+            'Контролировать работу, выполненную вашей командой, чтобы '
+            'убедиться, что она наилучшая возможная и соответствует целям '
+            'продукта, проверять, одобрять, задавать уточняющие вопросы или '
+            'делегировать последующую работу при необходимости.\n'
+        ),
+        'backstory': (
+            'Вы - главный директор по контенту в ведущем цифровом '
+            'маркетинговом агентстве, специализирующемся на брендинге '
+            'продуктов. Вы обеспечиваете, чтобы ваша команда создавала '
+            'наилучший возможный контент для клиента.\n'
+        ),
+    },
+}
+AGENTS_CONFIG_SHA256 = (
+    'a549c059a57c8be0e24c411b65a2ab844339222f7468195dedf241632e781651'
+)
+
+
+# tasks.yaml
+TASKS_CONFIG = {
+    'research_task': {
+        'description': (
+            'Проведите тщательное исследование клиента и конкурентов в '
+            'контексте {customer_domain}. Убедитесь, что вы найдете любую '
+            'интересную и актуальную информацию, учитывая, что текущий год - '
+            '2024. Мы работаем с ними над следующим проектом: '
+            '{project_description}.\n'
+        ),
+        'expected_output': (
+            'Полный отчет о клиенте, его клиентах и конкурентах, включая их '
+            'демографию, предпочтения, позиционирование на рынке и '
+            'вовлеченность аудитории.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'project_understanding_task': {
+        'description': (
+            'Поймите детали проекта и целевую аудиторию для '
+            '{project_description}. Изучите предоставленные материалы и '
+            'соберите дополнительную информацию при необходимости.\n'
+        ),
+        'expected_output': (
+            'Подробное резюме проекта и профиль целевой аудитории.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'marketing_strategy_task': {
+        'description': (
+            'Сформулируйте комплексную маркетинговую стратегию для проекта '
+            '{project_description} клиента {customer_domain}. Используйте '
+            'инсайты из задачи исследования и понимания проекта для создания '
+            'высококачественной стратегии.\n'
+        ),
+        'expected_output': (
+            'Подробный документ маркетинговой стратегии, который описывает '
+            'цели, целевую аудиторию, ключевые сообщения и предлагаемые '
+            'тактики, обязательно включите название, тактики, каналы и KPI.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'campaign_idea_task': {
+        'description': (
+            'Разработайте креативные идеи маркетинговых кампаний для '
+            '{project_description}. Убедитесь, что идеи инновационные, '
+            'увлекательные и соответствуют общей маркетинговой стратегии.\n'
+        ),
+        'expected_output': (
+            'Список из 5 креативных идей маркетинговых кампаний с описаниями, '
+            'целевой аудиторией и каналами.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'copy_creation_task': {
+        'description': (
+            'Создайте маркетинговые копии на основе одобренных идей кампаний '
+            'для {project_description}. Убедитесь, что копии убедительные, '
+            'понятные и адаптированы под целевую аудиторию.\n'
+        ),
+        'expected_output': 'Маркетинговые копии для каждой идеи кампании.\n',
+        'output_format': 'raw',
+    },
+}
+TASKS_CONFIG_SHA256 = (
+    'b83f86263e56305f1e60a45d8a4bad1e17c49f554b2cfef3d65c721d13ecf229'
+)
+
+
+# agents_gaming.yaml
+AGENTS_GAMING_CONFIG = {
+    'gaming_market_analyst': {
+        'role': 'Аналитик игрового рынка\n',
+        'goal': (
+            'Проводить глубокий анализ игрового рынка, конкурентов и '
+            'аудитории для разработки эффективных маркетинговых стратегий в '
+            'игровой индустрии.\n'
+        ),
+        'backstory': (
+            'Как опытный аналитик игрового рынка с 8-летним стажем, вы '
+            'специализируетесь на анализе мобильных игр, игровых сообществ и '
+            'поведении игроков. Вы понимаете специфику игровой индустрии, '
+            'включая правовые аспекты, технические ограничения и психологию '
+            'игроков.\n'
+        ),
+    },
+    'gaming_strategist': {
+        'role': 'Игровой маркетинговый стратег\n',
+        'goal': (
+            'Создавать инновационные маркетинговые стратегии для игровых '
+            'продуктов, учитывая особенности игровой аудитории и специфику '
+            'игровой индустрии.\n'
+        ),
+        'backstory': (
+            'Вы - ведущий маркетинговый стратег в игровой индустрии с опытом '
+            'запуска успешных кампаний для мобильных игр. Вы понимаете '
+            'психологию игроков, особенности игровых сообществ и эффективные '
+            'каналы продвижения в игровой сфере.\n'
+        ),
+    },
+    'community_manager': {
+        'role': 'Менеджер игрового сообщества\n',
+        'goal': (
+            'Разрабатывать стратегии взаимодействия с игровым сообществом, '
+            'создавать контент для Telegram и Discord, управлять репутацией '
+            'продукта.\n'
+        ),
+        'backstory': (
+            'Как опытный менеджер игрового сообщества, вы управляли крупными '
+            'игровыми сообществами в Telegram и Discord. Вы знаете, как '
+            'работать с игроками, создавать вовлекающий контент и управлять '
+            'репутацией в игровой среде.\n'
+        ),
+    },
+    'content_creator_gaming': {
+        'role': 'Креативный контент-мейкер для игр\n',
+        'goal': (
+            'Создавать увлекательный контент для игровой аудитории, включая '
+            'видео, посты, гайды и рекламные материалы, адаптированные под '
+            'игровое сообщество.\n'
+        ),
+        'backstory': (
+            'Вы - креативный контент-мейкер с 5-летним опытом создания '
+            'контента для игровой индустрии. Вы создаете видео, посты, гайды '
+            'и рекламные материалы, которые находят отклик у игровой '
+            'аудитории и вызывают доверие.\n'
+        ),
+    },
+    'legal_compliance_specialist': {
+        'role': 'Специалист по правовому соответствию\n',
+        'goal': (
+            'Обеспечивать соответствие маркетинговых материалов правовым '
+            'требованиям, разрабатывать стратегии минимизации рисков в '
+            'игровой индустрии.\n'
+        ),
+        'backstory': (
+            'Как специалист по правовому соответствию в игровой индустрии, вы '
+            'понимаете правовые аспекты игровой индустрии, включая вопросы '
+            'авторского права, пользовательских соглашений и рекламного '
+            'законодательства.\n'
+        ),
+    },
+    'technical_marketing_specialist': {
+        'role': 'Технический маркетинговый специалист\n',
+        'goal': (
+            'Создавать технически точные маркетинговые материалы, объяснять '
+            'сложные технические концепции простым языком для игровой '
+            'аудитории.\n'
+        ),
+        'backstory': (
+            'Вы - технический маркетинговый специалист с опытом продвижения '
+            'технических продуктов в игровой сфере. Вы умеете объяснять '
+            'сложные технические концепции простым языком, понятным игровой '
+            'аудитории. '
+        ),
+    },
+}
+AGENTS_GAMING_CONFIG_SHA256 = (
+    'c3506d40411a910a6d797540ff2c138a1e8877983646ff4680bb15bb6607f861'
+)
+
+
+# tasks_gaming.yaml
+TASKS_GAMING_CONFIG = {
+    'gaming_market_research_task': {
+        'description': (
+            'Проведите комплексное исследование игрового рынка для бота '
+            'автоматизации Puzzle & Survival. Проанализируйте целевую '
+            'аудиторию в России и ближнем зарубежье, изучите конкурентов, '
+            'особенности игрового сообщества в Telegram и Discord. Учтите '
+            'правовые аспекты использования ботов в играх и специфику '
+            'русскоязычной и англоязычной аудитории.\n'
+        ),
+        'expected_output': (
+            'Подробный анализ игрового рынка, включая профиль целевой '
+            'аудитории, конкурентный анализ, особенности игровых сообществ, '
+            'правовые риски и возможности для продвижения.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_audience_analysis_task': {
+        'description': (
+            'Проанализируйте целевую аудиторию бота автоматизации для Puzzle '
+            '& Survival. Изучите поведение игроков, их потребности, болевые '
+            'точки и мотивацию к использованию автоматизации. Учтите различия '
+            'между русскоязычной и англоязычной аудиторией, а также '
+            'особенности игроков из России и ближнего зарубежья.\n'
+        ),
+        'expected_output': (
+            'Детальный профиль целевой аудитории с сегментацией по языкам, '
+            'регионам, игровому опыту и потребностям в автоматизации.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_legal_risk_assessment_task': {
+        'description': (
+            'Оцените правовые риски использования бота автоматизации в Puzzle '
+            '& Survival. Проанализируйте пользовательское соглашение игры, '
+            'возможные нарушения правил, риски блокировки аккаунтов и '
+            'правовые последствия. Разработайте стратегии минимизации рисков '
+            'и правового позиционирования продукта.\n'
+        ),
+        'expected_output': (
+            'Анализ правовых рисков, стратегии минимизации, рекомендации по '
+            'позиционированию и правовому соответствию маркетинговых '
+            'материалов.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_community_strategy_task': {
+        'description': (
+            'Разработайте стратегию работы с игровым сообществом в Telegram и '
+            'Discord. Создайте план создания и управления сообществами, '
+            'контент-стратегию, методы привлечения и удержания пользователей. '
+            'Учтите особенности русскоязычных и англоязычных игровых '
+            'сообществ.\n'
+        ),
+        'expected_output': (
+            'Комплексная стратегия работы с сообществами, включая план '
+            'развития каналов, контент-стратегию, методы модерации и '
+            'вовлечения аудитории.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_marketing_strategy_task': {
+        'description': (
+            'Создайте комплексную маркетинговую стратегию для бота '
+            'автоматизации Puzzle & Survival. Учтите результаты анализа '
+            'рынка, аудитории и правовых рисков. Разработайте стратегию '
+            'позиционирования, каналы продвижения, контент-план и KPI. Фокус '
+            'на русскоязычную и англоязычную аудиторию в России и ближнем '
+            'зарубежье.\n'
+        ),
+        'expected_output': (
+            'Детальная маркетинговая стратегия с позиционированием, каналами '
+            'продвижения, контент-планом, бюджетом и ключевыми показателями '
+            'эффективности.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_content_creation_task': {
+        'description': (
+            'Разработайте креативные идеи контента для продвижения бота '
+            'автоматизации. Создайте концепции видео, постов, гайдов и '
+            'рекламных материалов. Учтите особенности игровой аудитории, '
+            'правовые ограничения и необходимость адаптации для русскоязычной '
+            'и англоязычной аудитории.\n'
+        ),
+        'expected_output': (
+            'Портфолио креативных идей контента с описаниями, целевой '
+            'аудиторией, каналами размещения и ожидаемым эффектом.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_technical_positioning_task': {
+        'description': (
+            'Разработайте техническое позиционирование бота автоматизации. '
+            'Создайте объяснения функциональности, преимуществ и безопасности '
+            'продукта простым языком для игровой аудитории. Учтите '
+            'технические ограничения и необходимость развеивания опасений '
+            'пользователей.\n'
+        ),
+        'expected_output': (
+            'Техническое позиционирование продукта с объяснением '
+            'функциональности, преимуществ, безопасности и ответов на частые '
+            'вопросы пользователей.\n'
+        ),
+        'output_format': 'raw',
+    },
+    'gaming_campaign_execution_task': {
+        'description': (
+            'Создайте детальный план выполнения маркетинговой кампании для '
+            'бота. Разработайте пошаговый план запуска, временные рамки, '
+            'ресурсы и методы измерения эффективности. Учтите особенности '
+            'игровой индустрии и необходимость адаптации для разных языковых '
+            'аудиторий.\n'
+        ),
+        'expected_output': (
+            'Детальный план выполнения кампании с временными рамками, '
+            'ресурсами, методами измерения и планом корректировок на основе '
+            'результатов.\n'
+        ),
+        'output_format': 'raw',
+    },
+}
+TASKS_GAMING_CONFIG_SHA256 = (
+    'cd74002ad9fb219d1b71e732489e883a61bb4656999c125270f60608c0fef9e3'
+)
+
+
+# gaming_inputs.yaml
+GAMING_INPUTS_CONFIG = {
+    'project_info': {
+        'product_name': 'Puzzle & Survival Automation Bot',
+        'game_name': 'Puzzle & Survival',
+        'target_regions': [
+            'Россия',
+            'Ближнее зарубежье',
+        ],
+        'target_languages': [
+            'Русский',
+            'Английский',
+        ],
+        'primary_channels': [
+            'Telegram',
+            'Discord',
+        ],
+        'company_resources': 'Полные ресурсы компании-провайдера',
+    },
+    'product_description': (
+        'Бот автоматизации для игры Puzzle & Survival, доступный через '
+        'Telegram. Функциональность включает автоматический сбор ресурсов, '
+        'выполнение ежедневных квестов, прокачку юнитов и другие рутинные '
+        'задачи. Бот не является пиратским софтом, не взламывает игру и не '
+        'предоставляет нечестных преимуществ - только автоматизирует '
+        'монотонные процессы для экономии времени игроков.\n'
+    ),
+    'target_audience': {
+        'primary': [
+            'Игроки Puzzle & Survival из России и ближнего зарубежья',
+            'Русскоязычная и англоязычная аудитория',
+            'Игроки, ценящие время и удобство',
+            'Пользователи Telegram и Discord',
+        ],
+        'secondary': [
+            'Игроки других мобильных игр',
+            'Потенциальные клиенты для других ботов автоматизации',
+        ],
+    },
+    'key_features': [
+        'Автоматический сбор ресурсов',
+        'Выполнение ежедневных квестов',
+        'Прокачка юнитов',
+        'Управление через Telegram',
+        'Безопасность и стабильность работы',
+        'Простота использования',
+    ],
+    'legal_considerations': [
+        'Бот может нарушать правила пользовательского соглашения игры',
+        'Не является пиратским софтом',
+        'Не взламывает игру',
+        'Не предоставляет нечестных преимуществ',
+        'Риск блокировки аккаунтов пользователей',
+    ],
+    'market_opportunities': [
+        'Большое игровое сообщество в Telegram и Discord',
+        'Высокая потребность в автоматизации рутинных задач',
+        'Лояльная игровая аудитория',
+        'Возможность монетизации через подписку',
+    ],
+    'challenges': [
+        'Правовые риски использования',
+        'Возможные блокировки аккаунтов',
+        'Необходимость объяснения легальности продукта',
+        'Конкуренция с другими ботами',
+        'Технические ограничения игры',
+    ],
+    'success_metrics': [
+        'Количество активных пользователей',
+        'Конверсия в платящих клиентов',
+        'Удержание пользователей',
+        'Рост сообщества в Telegram/Discord',
+        'Положительные отзывы и рекомендации',
+    ],
+}
+GAMING_INPUTS_CONFIG_SHA256 = (
+    '664182edd7747530095fdf7b2a56c8f6a4e2072a4fb43f0cb882927aa964cdad'
+)
+
+
+# SHA-256 исходного YAML -> разобранная конфигурация
+COMPILED_CONFIGS = {
+    AGENTS_CONFIG_SHA256: AGENTS_CONFIG,
+    TASKS_CONFIG_SHA256: TASKS_CONFIG,
+    AGENTS_GAMING_CONFIG_SHA256: AGENTS_GAMING_CONFIG,
+    TASKS_GAMING_CONFIG_SHA256: TASKS_GAMING_CONFIG,
+    GAMING_INPUTS_CONFIG_SHA256: GAMING_INPUTS_CONFIG,
+}
@@ -1,14 +1,321 @@
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import requests
-from typing import Optional, List, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Any, Dict, Tuple
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.prompts import BasePromptTemplate
-from pydantic import Field
-from dotenv import load_dotenv
+from pydantic import Field, PrivateAttr
+from marketing_posts.core.batch_runner import TransientError
 
-# Загружаем переменные окружения
-load_dotenv()
+try:
+    # orjson - необязательная зависимость, заметно быстрее stdlib json
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Сериализует тело запроса в JSON (bytes)."""
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Разбирает тело ответа из JSON за один проход."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Ответы, при которых запрос точно не обработан сервером
+_TRANSIENT_STATUSES = (429, 503)
+
+
+class DeepSeekAPIError(Exception):
+    """Ошибка обращения к DeepSeek API (повтор не поможет)."""
+
+
+class DeepSeekTransientError(DeepSeekAPIError, TransientError):
+    """
+    Временная ошибка DeepSeek API.
+    
+    Запрос не был обработан сервером (соединение не установлено или
+    ответ 429/503), поэтому его можно безопасно повторить.
+    """
+
+
+def _is_transient(error: "requests.RequestException") -> bool:
+    """
+    Проверяет, что запрос завершился ошибкой до обработки сервером.
+    
+    Таймаут чтения и обрыв соединения после отправки запроса не
+    считаются временными: ответ мог быть уже сгенерирован и оплачен.
+    """
+    import requests
+    from urllib3.exceptions import ProtocolError
+    
+    exceptions = requests.exceptions
+    if isinstance(error, exceptions.RetryError):
+        # Повторы сессии на 429/503 исчерпаны
+        return True
+    if isinstance(error, exceptions.HTTPError):
+        response = error.response
+        return (
+            response is not None
+            and response.status_code in _TRANSIENT_STATUSES
+        )
+    if isinstance(error, exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, exceptions.ConnectionError):
+        reason = error.args[0] if error.args else None
+        return not isinstance(reason, ProtocolError)
+    return False
+
+
+# API ключ читается один раз при импорте модуля
+# (.env загружается в marketing_posts/__init__.py)
+_DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
+
+
+class _ResponseCache:
+    """
+    Потокобезопасный LRU-кэш ответов LLM с ограничением времени жизни.
+    
+    Используется только для детерминированных запросов (temperature == 0),
+    когда повторный запрос с тем же промптом вернет тот же ответ.
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        """
+        Инициализирует кэш.
+        
+        Args:
+            maxsize: Максимальное количество записей
+            ttl: Время жизни записи в секундах
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        temperature: float,
+        stop: Optional[List[str]],
+        max_tokens: int
+    ) -> str:
+        """Формирует SHA-256 ключ запроса."""
+        raw = "\0".join((
+            model,
+            prompt,
+            repr(temperature),
+            "\x1f".join(stop or ()),
+            str(max_tokens)
+        ))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Возвращает кэшированный ответ или None."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key: str, value: str) -> None:
+        """Сохраняет ответ, вытесняя самые старые записи."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Очищает кэш и счетчики."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """Возвращает статистику попаданий."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data)
+            }
+
+
+class SemanticCache:
+    """
+    Семантический кэш ответов LLM.
+    
+    Возвращает сохраненный ответ, если косинусное сходство эмбеддинга
+    нового промпта с одним из сохраненных не ниже порога. Записи
+    разделяются по пространствам имен (модель и параметры генерации,
+    см. make_namespace), размер каждого ограничен, старые записи
+    вытесняются в порядке FIFO.
+    
+    Требует пакеты numpy и sentence-transformers; модель эмбеддингов
+    загружается лениво при первом обращении.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ):
+        """
+        Инициализирует семантический кэш.
+        
+        Args:
+            threshold: Минимальное косинусное сходство для попадания
+            max_entries: Максимальное число записей на пространство имен
+            model_name: Модель sentence-transformers для эмбеддингов
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._encoder: Any = None
+        self._embeddings: Dict[str, Any] = {}
+        self._responses: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def make_namespace(
+        model: str,
+        temperature: float,
+        stop: Optional[List[str]],
+        max_tokens: int
+    ) -> str:
+        """
+        Формирует пространство имен для параметров запроса.
+        
+        Ответ, обрезанный стоп-последовательностью или малым max_tokens,
+        не должен отдаваться запросу с другими ограничениями, поэтому
+        параметры входят в ключ так же, как в точном кэше.
+        """
+        return "\0".join((
+            model,
+            repr(temperature),
+            "\x1f".join(stop or ()),
+            str(max_tokens)
+        ))
+    
+    def embed(self, text: str) -> Any:
+        """Возвращает нормированный эмбеддинг текста."""
+        with self._lock:
+            if self._encoder is None:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode(text, normalize_embeddings=True)
+    
+    def lookup(self, namespace: str, embedding: Any) -> Optional[str]:
+        """Ищет ближайший сохраненный промпт и возвращает его ответ."""
+        with self._lock:
+            embeddings = self._embeddings.get(namespace)
+            if embeddings is None:
+                return None
+            # Эмбеддинги нормированы: скалярное произведение = косинус
+            scores = embeddings @ embedding
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold:
+                return self._responses[namespace][best]
+            return None
+    
+    def add(self, namespace: str, embedding: Any, response: str) -> None:
+        """Сохраняет ответ для эмбеддинга промпта."""
+        import numpy as np
+        
+        with self._lock:
+            embeddings = self._embeddings.get(namespace)
+            responses = self._responses.setdefault(namespace, [])
+            row = np.asarray(embedding, dtype=np.float32)[np.newaxis, :]
+            if embeddings is None:
+                embeddings = row
+            else:
+                embeddings = np.vstack((embeddings, row))
+            responses.append(response)
+            if len(responses) > self.max_entries:
+                embeddings = embeddings[1:]
+                del responses[0]
+            self._embeddings[namespace] = embeddings
+    
+    def clear(self) -> None:
+        """Очищает кэш (модель эмбеддингов остается загруженной)."""
+        with self._lock:
+            self._embeddings.clear()
+            self._responses.clear()
+
+
+# Общий кэш ответов для всех экземпляров DeepSeekLLM
+_RESPONSE_CACHE = _ResponseCache()
+
+# Семантический кэш включается явно через
+# DeepSeekLLM.enable_semantic_cache()
+_SEMANTIC_CACHE: Optional[SemanticCache] = None
+
+# Общая HTTP-сессия: переиспользует TCP/TLS соединения между запросами
+_SESSION: Optional["requests.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> "requests.Session":
+    """Возвращает общую HTTP-сессию с пулом keep-alive соединений."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                # POST /chat/completions не идемпотентен: повторяем только
+                # ошибки соединения и ответы 429/503, при которых запрос
+                # точно не обработан. Таймаут чтения не повторяется -
+                # сервер мог уже сгенерировать (и выставить в счет) ответ
+                retries = Retry(
+                    total=2,
+                    read=0,
+                    backoff_factor=0.2,
+                    status_forcelist=_TRANSIENT_STATUSES,
+                    allowed_methods=None,
+                    respect_retry_after_header=True
+                )
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=8,
+                        pool_maxsize=32,
+                        max_retries=retries
+                    )
+                )
+                _SESSION = session
+    return _SESSION
 
 
 class DeepSeekLLM(BaseLanguageModel):
@@ -19,10 +326,13 @@ class DeepSeekLLM(BaseLanguageModel):
     api_key: Optional[str] = Field(default=None)
     base_url: str = Field(default="https://api.deepseek.com/v1")
     
+    _headers: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _url: str = PrivateAttr(default="")
+    
     def __init__(self, **kwargs):
         # Получаем API ключ из переменных окружения если не передан или None
         if 'api_key' not in kwargs or kwargs.get('api_key') is None:
-            kwargs['api_key'] = os.getenv("DEEPSEEK_API_KEY")
+            kwargs['api_key'] = _DEEPSEEK_API_KEY
         
         if not kwargs.get('api_key'):
             raise ValueError(
@@ -30,9 +340,18 @@ class DeepSeekLLM(BaseLanguageModel):
             )
         
         # Убираем None значения, чтобы Pydantic использовал значения по умолчанию
-        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        for key in ("model", "temperature", "base_url"):
+            if key in kwargs and kwargs[key] is None:
+                del kwargs[key]
         
         super().__init__(**kwargs)
+        
+        # Статические части запроса собираем один раз
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._url = f"{self.base_url}/chat/completions"
     
     def _call(
         self,
@@ -42,37 +361,176 @@ class DeepSeekLLM(BaseLanguageModel):
         **kwargs: Any,
     ) -> str:
         """Выполнить запрос к DeepSeek API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        import requests
+        
+        max_tokens = kwargs.get("max_tokens", 1000)
+        
+        # Детерминированные запросы отдаем из кэша без обращения к сети
+        cache_key = None
+        if self.temperature == 0:
+            cache_key = _ResponseCache.make_key(
+                self.model, prompt, self.temperature, stop, max_tokens
+            )
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Перефразированные запросы ищем в семантическом кэше
+        semantic_cache = _SEMANTIC_CACHE
+        prompt_embedding = None
+        namespace = ""
+        if semantic_cache is not None:
+            namespace = SemanticCache.make_namespace(
+                self.model, self.temperature, stop, max_tokens
+            )
+            prompt_embedding = semantic_cache.embed(prompt)
+            cached = semantic_cache.lookup(namespace, prompt_embedding)
+            if cached is not None:
+                return cached
         
         data = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": self.temperature,
-            "max_tokens": kwargs.get("max_tokens", 1000)
+            "max_tokens": max_tokens
         }
         
         if stop:
             data["stop"] = stop
         
         try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=data,
+            response = _get_session().post(
+                self._url,
+                headers=self._headers,
+                data=_json_dumps(data),
                 timeout=30
             )
             response.raise_for_status()
             
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+            result = _json_loads(response.content)
+            content: str = result["choices"][0]["message"]["content"]
+            
+            if cache_key is not None:
+                _RESPONSE_CACHE.set(cache_key, content)
+            if semantic_cache is not None:
+                semantic_cache.add(namespace, prompt_embedding, content)
+            
+            return content
             
         except requests.exceptions.RequestException as e:
-            raise Exception(f"Ошибка запроса к DeepSeek API: {e}")
-        except KeyError as e:
-            raise Exception(f"Неожиданный формат ответа от DeepSeek API: {e}")
+            # Тип исключения позволяет BatchRunner повторять только
+            # временные ошибки, но не 401/403 и таймауты чтения
+            error_cls = (
+                DeepSeekTransientError if _is_transient(e)
+                else DeepSeekAPIError
+            )
+            raise error_cls(f"Ошибка запроса к DeepSeek API: {e}") from e
+        except (KeyError, ValueError) as e:
+            raise DeepSeekAPIError(
+                f"Неожиданный формат ответа от DeepSeek API: {e}"
+            ) from e
+    
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Асинхронный запрос к DeepSeek API без блокировки event loop"""
+        return await asyncio.to_thread(self._call, prompt, stop, **kwargs)
+    
+    async def _acall_guarded(
+        self,
+        semaphore: asyncio.Semaphore,
+        prompt: str,
+        **kwargs: Any,
+    ) -> str:
+        """Асинхронный запрос с ограничением параллелизма"""
+        async with semaphore:
+            return await self._acall(prompt, **kwargs)
+    
+    async def abatch_prompts(
+        self,
+        inputs: List[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        Параллельно выполняет независимые строковые промпты.
+        
+        Отдельное имя, а не переопределение Runnable.abatch: промпты
+        передаются в _call как есть, без преобразования входов,
+        callbacks и config.
+        
+        Args:
+            inputs: Список промптов
+            concurrency: Максимальное число одновременных запросов
+            
+        Returns:
+            Ответы в порядке промптов
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(
+            self._acall_guarded(semaphore, prompt, **kwargs)
+            for prompt in inputs
+        ))
+    
+    def batch_prompts(
+        self,
+        inputs: List[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> List[str]:
+        """
+        Синхронная версия abatch_prompts.
+        
+        Использует пул потоков вместо asyncio.run, поэтому безопасна
+        для вызова из кода, где уже запущен event loop.
+        """
+        if not inputs:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(inputs))
+        ) as executor:
+            return list(executor.map(
+                lambda prompt: self._call(prompt, **kwargs), inputs
+            ))
+    
+    @classmethod
+    def enable_semantic_cache(
+        cls,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ) -> SemanticCache:
+        """
+        Включает семантический кэш для всех экземпляров DeepSeekLLM.
+        
+        Требует установленных numpy и sentence-transformers.
+        """
+        global _SEMANTIC_CACHE
+        _SEMANTIC_CACHE = SemanticCache(threshold, max_entries, model_name)
+        return _SEMANTIC_CACHE
+    
+    @classmethod
+    def disable_semantic_cache(cls) -> None:
+        """Выключает семантический кэш."""
+        global _SEMANTIC_CACHE
+        _SEMANTIC_CACHE = None
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Очищает кэш ответов."""
+        _RESPONSE_CACHE.clear()
+        if _SEMANTIC_CACHE is not None:
+            _SEMANTIC_CACHE.clear()
+    
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, int]:
+        """Возвращает статистику кэша ответов (hits/misses/size)."""
+        return _RESPONSE_CACHE.stats()
     
     def _llm_type(self) -> str:
         """Тип LLM"""
@@ -114,11 +572,11 @@ class DeepSeekLLM(BaseLanguageModel):
         **kwargs: Any
     ) -> str:
         """Асинхронный вызов LLM"""
-        return self.invoke(input, config, **kwargs)
+        return await self._acall(input, **kwargs)
     
     async def apredict(self, text: str, **kwargs: Any) -> str:
         """Асинхронное предсказание для текста"""
-        return self.predict(text, **kwargs)
+        return await self._acall(text, **kwargs)
     
     async def apredict_messages(
         self, 
@@ -126,7 +584,9 @@ class DeepSeekLLM(BaseLanguageModel):
         **kwargs: Any
     ) -> str:
         """Асинхронное предсказание для сообщений"""
-        return self.predict_messages(messages, **kwargs)
+        return await asyncio.to_thread(
+            self.predict_messages, messages, **kwargs
+        )
     
     async def agenerate_prompt(
         self, 
@@ -134,7 +594,7 @@ class DeepSeekLLM(BaseLanguageModel):
         **kwargs: Any
     ) -> str:
         """Асинхронная генерация из промпта"""
-        return self.generate_prompt(prompt, **kwargs)
+        return await self._acall(str(prompt), **kwargs)
 
 
 class LLMConfig:
@@ -147,6 +607,12 @@ class LLMConfig:
         api_key: Optional[str] = None
     ) -> BaseLanguageModel:
         """Получить DeepSeek LLM"""
+        # Проверяем модель заранее, не дожидаясь ошибки от API
+        if model is not None and model not in _VALID_MODELS:
+            raise ValueError(
+                f"Неизвестная модель DeepSeek: {model}. "
+                f"Доступные модели: {sorted(_VALID_MODELS)}"
+            )
         return DeepSeekLLM(
             model=model,
             temperature=temperature,
@@ -154,11 +620,17 @@ class LLMConfig:
         )
     
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def get_default_llm(
         provider: str = "deepseek", 
         **kwargs
     ) -> BaseLanguageModel:
-        """Получить LLM по умолчанию (только DeepSeek)"""
+        """
+        Получить LLM по умолчанию (только DeepSeek).
+        
+        Результат кэшируется по аргументам: повторные вызовы с теми же
+        provider/model/temperature возвращают уже созданный экземпляр.
+        """
         if provider.lower() == "deepseek":
             return LLMConfig.get_deepseek_llm(**kwargs)
         else:
@@ -174,4 +646,7 @@ AVAILABLE_MODELS = {
         "deepseek-chat": "DeepSeek Chat (DeepSeek)",
         "deepseek-reasoner": "DeepSeek Reasoner (DeepSeek)"
     }
-} 
\ No newline at end of file
+}
+
+# Плоское множество имен моделей для проверки за O(1)
+_VALID_MODELS = frozenset(AVAILABLE_MODELS["deepseek"])
@@ -3,24 +3,111 @@
 Определяет интерфейс, который должны реализовывать все crew конфигурации.
 """
 
-from typing import Dict, Any, Optional, List
+import functools
+import operator
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Any, Optional, List, Tuple, TypeVar
+)
 from dataclasses import dataclass
-from crewai import Agent, Task, Crew, Process
-from marketing_posts.config.llm_config import LLMConfig
 
+if TYPE_CHECKING:
+    # crewai импортируется лениво: он тянет pydantic, langchain и т.д.
+    from crewai import Agent, Task, Crew
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CrewConfig:
-    """Конфигурация для инициализации crew."""
+    """
+    Конфигурация для инициализации crew.
+    
+    Неизменяема и хешируема: изменения выполняются через
+    dataclasses.replace (см. CrewBuilder).
+    """
     llm_provider: str = "deepseek"
     llm_model: Optional[str] = None
     agents_config: str = "config/agents.yaml"
     tasks_config: str = "config/tasks.yaml"
     verbose: bool = True
     memory: bool = False
+    process: str = "sequential"
+    
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """
+        Возвращает хешируемый отпечаток конфигурации.
+        
+        Помимо самих полей включает mtime и размер файлов конфигураций
+        агентов и задач, поэтому после их изменения отпечаток меняется.
+        """
+        stats: List[Optional[Tuple[int, int]]] = []
+        for config_path in (self.agents_config, self.tasks_config):
+            try:
+                stat = (_PACKAGE_DIR / config_path).stat()
+                stats.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stats.append(None)
+        return (self, *stats)
+
+
+# Пути конфигураций в CrewConfig указываются относительно пакета
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Поддерживаемые значения crewai.Process
+_PROCESSES = frozenset({"sequential", "hierarchical"})
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+# Поля конфигураций агентов и задач, извлекаемые одним вызовом
+AGENT_FIELDS = operator.itemgetter('role', 'goal', 'backstory')
+TASK_FIELDS = operator.itemgetter('description', 'expected_output')
+
+
+def merge_defaults(
+    config: Dict[str, Any],
+    defaults: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Дополняет конфигурации компонентов значениями по умолчанию.
+    
+    Выполняется один раз при инициализации crew, после чего поля
+    читаются через AGENT_FIELDS/TASK_FIELDS без проверок наличия.
+    
+    Args:
+        config: Загруженная конфигурация агентов или задач
+        defaults: Значения по умолчанию по именам компонентов
+        
+    Returns:
+        Конфигурация, в которой у каждого компонента есть все поля
+    """
+    merged = dict(config)
+    for name, component_defaults in defaults.items():
+        merged[name] = {**component_defaults, **config.get(name, {})}
+    return merged
+
+
+def crew_component(method: _F) -> _F:
+    """
+    Кэширует агента или задачу в пределах экземпляра crew.
+    
+    Задачи, ссылающиеся на одного агента, и get_agents() получают
+    один и тот же объект вместо новой копии при каждом вызове.
+    """
+    name = method.__name__
+    
+    @functools.wraps(method)
+    def wrapper(self: 'BaseCrew') -> Any:
+        components = self._components
+        try:
+            return components[name]
+        except KeyError:
+            component = components[name] = method(self)
+            return component
+    
+    return wrapper  # type: ignore[return-value]
 
 
-class BaseCrew:
+class BaseCrew(ABC):
     """
     Базовый класс для всех реализаций crew.
     
@@ -29,6 +116,9 @@ class BaseCrew:
     для инициализации и выполнения crew.
     """
     
+    # Наследники объявляют свои __slots__ для собственных атрибутов
+    __slots__ = ('config', 'llm', '_components')
+    
     def __init__(self, config: CrewConfig):
         """
         Инициализирует crew с заданной конфигурацией.
@@ -36,7 +126,10 @@ class BaseCrew:
         Args:
             config: Объект конфигурации crew
         """
+        from marketing_posts.config.llm_config import LLMConfig
+        
         self.config = config
+        self._components: Dict[str, Any] = {}
         self.llm = LLMConfig.get_default_llm(
             provider=config.llm_provider,
             model=config.llm_model
@@ -44,38 +137,72 @@ class BaseCrew:
         self._validate_config()
         self._initialize_crew()
     
+    @classmethod
+    def validate_config(cls, config: CrewConfig) -> None:
+        """
+        Статически проверяет конфигурацию без создания crew.
+        
+        Не обращается к сети, не загружает YAML и не создает LLM.
+        Наследники расширяют проверку своими требованиями.
+        
+        Args:
+            config: Конфигурация для проверки
+            
+        Raises:
+            ValueError: Если конфигурация невалидна
+        """
+        from marketing_posts.config.llm_config import AVAILABLE_MODELS
+        
+        provider_models = AVAILABLE_MODELS.get(config.llm_provider.lower())
+        if provider_models is None:
+            raise ValueError(
+                f"Неподдерживаемый провайдер: {config.llm_provider}"
+            )
+        if config.llm_model is not None and (
+            config.llm_model not in provider_models
+        ):
+            raise ValueError(f"Неизвестная модель: {config.llm_model}")
+        if config.process not in _PROCESSES:
+            raise ValueError(f"Неизвестный тип процесса: {config.process}")
+    
     def _validate_config(self) -> None:
         """Валидирует конфигурацию crew."""
-        # Базовая реализация - переопределяется в наследниках
-        pass
+        self.validate_config(self.config)
     
     def _initialize_crew(self) -> None:
         """Инициализирует компоненты, специфичные для crew."""
         # Базовая реализация - переопределяется в наследниках
         pass
     
-    def get_agents(self) -> List[Agent]:
+    @abstractmethod
+    def get_agents(self) -> List['Agent']:
         """Возвращает список агентов для этого crew."""
-        # Должно быть переопределено в наследниках
-        raise NotImplementedError("Метод get_agents должен быть реализован")
     
-    def get_tasks(self) -> List[Task]:
+    @abstractmethod
+    def get_tasks(self) -> List['Task']:
         """Возвращает список задач для этого crew."""
-        # Должно быть переопределено в наследниках
-        raise NotImplementedError("Метод get_tasks должен быть реализован")
     
-    def create_crew(self) -> Crew:
+    def create_crew(self) -> 'Crew':
         """
         Создает и возвращает экземпляр crew.
         
         Returns:
             Настроенный экземпляр crew
         """
+        from crewai import Crew, Process
+        
+        process = Process(self.config.process)
+        extra: Dict[str, Any] = {}
+        if process == Process.hierarchical:
+            # Менеджер распределяет независимые задачи между агентами
+            extra['manager_llm'] = self.llm
+        
         return Crew(
             agents=self.get_agents(),
             tasks=self.get_tasks(),
-            process=Process.sequential,
-            verbose=self.config.verbose
+            process=process,
+            verbose=self.config.verbose,
+            **extra
         )
     
     def execute(self, inputs: Dict[str, Any]) -> Any:
@@ -91,6 +218,22 @@ class BaseCrew:
         crew_instance = self.create_crew()
         return crew_instance.kickoff(inputs=inputs)
     
+    async def execute_async(self, inputs: Dict[str, Any]) -> Any:
+        """
+        Асинхронно выполняет crew с заданными входными данными.
+        
+        Не блокирует цикл событий, поэтому несколько crew могут
+        выполняться одновременно.
+        
+        Args:
+            inputs: Входные данные для выполнения crew
+            
+        Returns:
+            Результаты выполнения
+        """
+        crew_instance = self.create_crew()
+        return await crew_instance.kickoff_async(inputs=inputs)
+    
     def get_config_info(self) -> Dict[str, Any]:
         """
         Возвращает информацию о конфигурации этого crew.
@@ -103,5 +246,6 @@ class BaseCrew:
             'llm_model': self.config.llm_model,
             'agents_config': self.config.agents_config,
             'tasks_config': self.config.tasks_config,
+            'process': self.config.process,
             'crew_type': self.__class__.__name__
         } 
\ No newline at end of file
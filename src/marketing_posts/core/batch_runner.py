@@ -0,0 +1,163 @@
+"""
+Пакетный запуск crew с ограничением параллелизма, частоты запросов
+и повторными попытками при временных ошибках.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+
+class TransientError(Exception):
+    """
+    Временная ошибка, после которой задание можно безопасно повторить.
+    
+    Поднимается, когда запрос заведомо не был обработан (например,
+    DeepSeekTransientError при 429/503 или ошибке соединения).
+    """
+
+
+# Никогда не повторяются, даже если попадают под retry_on. Ошибки
+# конфигурации не исправятся повтором. Таймаут не останавливает crew
+# в рабочем потоке, и повтор запустил бы вторую копию параллельно
+_NON_RETRYABLE: Tuple[Type[BaseException], ...] = (
+    ValueError,
+    TypeError,
+    KeyError,
+    asyncio.TimeoutError
+)
+
+
+@dataclass(frozen=True)
+class ProcessorConfig:
+    """
+    Параметры пакетного выполнения.
+    
+    timeout_per_item по умолчанию не задан. kickoff_async выполняет crew
+    через asyncio.to_thread, поэтому по таймауту отменяется только
+    ожидание: поток продолжает работу (и расход токенов) до конца, а
+    задание завершается с TimeoutError без повторов.
+    
+    Повторяются только исключения из retry_on: каждый повтор заново
+    выполняет все вызовы LLM в crew, поэтому ошибки вроде 401/403 или
+    таймаута чтения (ответ мог быть уже оплачен) не повторяются.
+    """
+    max_workers: int = 5
+    timeout_per_item: Optional[float] = None
+    rpm: int = 60
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retry_on: Tuple[Type[BaseException], ...] = (TransientError,)
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запусков (запросов в минуту).
+    
+    Запуски равномерно распределяются во времени с интервалом 60 / rpm,
+    поэтому за любую минуту их не больше rpm.
+    """
+    
+    def __init__(self, rpm: int):
+        """
+        Инициализирует ограничитель.
+        
+        Args:
+            rpm: Максимальное число запусков в минуту (0 - без ограничения)
+        """
+        self._interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Ожидает свободный слот для следующего запуска."""
+        if not self._interval:
+            return
+        
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class BatchRunner:
+    """
+    Выполняет набор заданий с ограниченным параллелизмом.
+    
+    Семафор ограничивает число одновременных запусков, RateLimiter -
+    частоту запросов, а каждое задание повторяется с экспоненциальной
+    задержкой при временных ошибках (ProcessorConfig.retry_on). Ошибка
+    одного задания не прерывает остальные: вместо результата
+    возвращается исключение.
+    """
+    
+    def __init__(
+        self,
+        run_item: Callable[[Dict[str, Any]], Awaitable[Any]],
+        config: Optional[ProcessorConfig] = None
+    ):
+        """
+        Инициализирует пакетный runner.
+        
+        Args:
+            run_item: Корутина, выполняющая одно задание
+            config: Параметры выполнения
+        """
+        self.run_item = run_item
+        self.config = config or ProcessorConfig()
+    
+    def _backoff(self, attempt: int) -> float:
+        """Задержка перед повтором: экспонента плюс случайный разброс."""
+        config = self.config
+        delay = config.base_delay * 2.0 ** (attempt - 1)
+        delay += random.uniform(0, config.base_delay)
+        return min(delay, config.max_delay)
+    
+    async def _run_one(
+        self,
+        item: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        limiter: RateLimiter
+    ) -> Any:
+        """Выполняет одно задание с повторами."""
+        config = self.config
+        attempt = 1
+        while True:
+            try:
+                async with semaphore:
+                    await limiter.acquire()
+                    return await asyncio.wait_for(
+                        self.run_item(item),
+                        config.timeout_per_item
+                    )
+            except _NON_RETRYABLE:
+                raise
+            except config.retry_on:
+                if attempt >= config.max_attempts:
+                    raise
+            
+            # Ждем вне семафора, чтобы не занимать слот
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+    
+    async def run(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Выполняет все задания.
+        
+        Args:
+            items: Задания для выполнения
+            
+        Returns:
+            Результаты в порядке items; для упавших заданий - исключение
+        """
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        limiter = RateLimiter(self.config.rpm)
+        return await asyncio.gather(
+            *(self._run_one(item, semaphore, limiter) for item in items),
+            return_exceptions=True
+        )
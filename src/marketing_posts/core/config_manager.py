@@ -3,12 +3,23 @@
 Предоставляет централизованное управление конфигурациями с валидацией.
 """
 
-import yaml
+import copy
+import functools
+import hashlib
+import sys
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+try:
+    # Заранее разобранные конфигурации (tools/compile_configs.py)
+    from marketing_posts.config._compiled import (
+        COMPILED_CONFIGS as _COMPILED_CONFIGS
+    )
+except ImportError:
+    _COMPILED_CONFIGS = {}
+
 
 @dataclass
 class ConfigValidationError(Exception):
@@ -30,6 +41,9 @@ class ConfigValidator(ABC):
 class AgentsConfigValidator(ConfigValidator):
     """Валидатор для конфигурации агентов."""
     
+    REQUIRED_FIELDS = ('role', 'goal', 'backstory')
+    _REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+    
     def validate(self, config: Dict[str, Any]) -> None:
         """Валидирует структуру конфигурации агентов."""
         if not isinstance(config, dict):
@@ -38,8 +52,6 @@ class AgentsConfigValidator(ConfigValidator):
                 "agents.yaml"
             )
         
-        required_fields = ['role', 'goal', 'backstory']
-        
         for agent_name, agent_config in config.items():
             if not isinstance(agent_config, dict):
                 raise ConfigValidationError(
@@ -48,7 +60,11 @@ class AgentsConfigValidator(ConfigValidator):
                     agent_name
                 )
             
-            for field in required_fields:
+            # Быстрая проверка одним вызовом; поле ищем только при ошибке
+            if self._REQUIRED_SET.issubset(agent_config):
+                continue
+            
+            for field in self.REQUIRED_FIELDS:
                 if field not in agent_config:
                     raise ConfigValidationError(
                         f"Агент '{agent_name}' отсутствует обязательное поле: "
@@ -61,6 +77,9 @@ class AgentsConfigValidator(ConfigValidator):
 class TasksConfigValidator(ConfigValidator):
     """Валидатор для конфигурации задач."""
     
+    REQUIRED_FIELDS = ('description', 'expected_output')
+    _REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+    
     def validate(self, config: Dict[str, Any]) -> None:
         """Валидирует структуру конфигурации задач."""
         if not isinstance(config, dict):
@@ -69,8 +88,6 @@ class TasksConfigValidator(ConfigValidator):
                 "tasks.yaml"
             )
         
-        required_fields = ['description', 'expected_output']
-        
         for task_name, task_config in config.items():
             if not isinstance(task_config, dict):
                 raise ConfigValidationError(
@@ -79,7 +96,10 @@ class TasksConfigValidator(ConfigValidator):
                     task_name
                 )
             
-            for field in required_fields:
+            if self._REQUIRED_SET.issubset(task_config):
+                continue
+            
+            for field in self.REQUIRED_FIELDS:
                 if field not in task_config:
                     raise ConfigValidationError(
                         f"Задача '{task_name}' отсутствует обязательное поле: "
@@ -89,6 +109,87 @@ class TasksConfigValidator(ConfigValidator):
                     )
 
 
+def _intern_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Рекурсивно интернирует строковые ключи вложенных словарей.
+    
+    Поля конфигураций читаются многократно; для интернированных ключей
+    поиск в словаре сводится к сравнению указателей.
+    """
+    return {
+        sys.intern(key) if isinstance(key, str) else key: (
+            _intern_keys(value) if isinstance(value, dict) else value
+        )
+        for key, value in config.items()
+    }
+
+
+_VALIDATORS: Dict[str, ConfigValidator] = {
+    'agents': AgentsConfigValidator(),
+    'tasks': TasksConfigValidator()
+}
+
+
+class _YAMLParseError(Exception):
+    """Ошибка разбора YAML (обертка над yaml.YAMLError)."""
+
+
+def _parse_yaml(data: bytes) -> Any:
+    """
+    Разбирает YAML из байтов.
+    
+    PyYAML импортируется только здесь: если файл совпадает со
+    скомпилированной конфигурацией, модуль yaml не загружается вовсе.
+    """
+    import yaml
+    
+    # C-расширение libyaml разбирает YAML в разы быстрее
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        # libyaml сам определяет кодировку байтов и декодирует их
+        return yaml.load(data, Loader=loader)
+    except yaml.YAMLError as e:
+        raise _YAMLParseError(str(e)) from e
+
+
+@functools.lru_cache(maxsize=64)
+def _load_and_validate(
+    config_type: str,
+    abs_path: str,
+    mtime_ns: int,
+    size: int
+) -> Dict[str, Any]:
+    """
+    Загружает и валидирует YAML файл конфигурации.
+    
+    Результат кэшируется на уровне процесса и общий для всех экземпляров
+    ConfigManager. mtime_ns и размер входят в ключ кэша, поэтому
+    измененный файл будет перечитан даже при грубой точности mtime.
+    Кэшированный словарь не изменяется: наружу отдаются его копии.
+    
+    Если содержимое файла совпадает со скомпилированной версией
+    (по SHA-256), YAML не разбирается.
+    """
+    with open(abs_path, 'rb') as f:
+        data = f.read()
+    
+    config: Any = _COMPILED_CONFIGS.get(hashlib.sha256(data).hexdigest())
+    if config is None:
+        config = _parse_yaml(data)
+    
+    # Валидируем конфигурацию, если есть валидатор
+    validator = _VALIDATORS.get(config_type)
+    if validator is not None:
+        validator.validate(config)
+    
+    if not isinstance(config, dict):
+        # Конфигурации без валидатора могут быть не словарем
+        return config  # type: ignore[no-any-return]
+    
+    # Ключи интернируются один раз: кэшированный словарь переиспользуется
+    return _intern_keys(config)
+
+
 class ConfigManager:
     """
     Централизованный менеджер конфигураций для системы маркетинговых постов.
@@ -105,11 +206,9 @@ class ConfigManager:
             base_path: Базовый путь для файлов конфигурации
         """
         self.base_path = Path(base_path)
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._validators = {
-            'agents': AgentsConfigValidator(),
-            'tasks': TasksConfigValidator()
-        }
+        # Конфигурации, загруженные этим экземпляром (упорядоченное
+        # множество); сами данные хранятся в общем кэше
+        self._loaded: Dict[str, None] = {}
     
     def load_config(
         self, 
@@ -130,33 +229,29 @@ class ConfigManager:
             ConfigValidationError: Если валидация конфигурации не прошла
             FileNotFoundError: Если файл конфигурации не найден
         """
-        cache_key = f"{config_type}_{config_name}"
-        
-        # Возвращаем кэшированную конфигурацию, если доступна
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-        
         config_path = self.base_path / config_name
+        not_found_msg = f"Файл конфигурации не найден: {config_path}"
         
-        if not config_path.exists():
-            raise FileNotFoundError(
-                f"Файл конфигурации не найден: {config_path}"
-            )
+        # Один stat() и для проверки существования, и для ключа кэша
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(not_found_msg)
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            # Валидируем конфигурацию, если есть валидатор
-            if config_type in self._validators:
-                self._validators[config_type].validate(config)
-            
-            # Кэшируем конфигурацию
-            self._cache[cache_key] = config
-            
-            return config
+            config = _load_and_validate(
+                config_type,
+                str(config_path.absolute()),
+                stat.st_mtime_ns,
+                stat.st_size
+            )
+            self._loaded[f"{config_type}_{config_name}"] = None
+            # Копия защищает общий кэш от изменений вызывающим кодом
+            return copy.deepcopy(config)
             
-        except yaml.YAMLError as e:
+        except FileNotFoundError:
+            raise FileNotFoundError(not_found_msg)
+        except _YAMLParseError as e:
             raise ConfigValidationError(
                 f"Неверный YAML в {config_name}: {e}",
                 config_name
@@ -190,11 +285,18 @@ class ConfigManager:
     
     def clear_cache(self) -> None:
         """Очищает кэш конфигураций."""
-        self._cache.clear()
+        self._loaded.clear()
+        _load_and_validate.cache_clear()
     
     def get_cache_info(self) -> Dict[str, Any]:
-        """Возвращает информацию о кэшированных конфигурациях."""
+        """
+        Возвращает информацию о кэшированных конфигурациях.
+        
+        Помимо списка конфигураций экземпляра содержит статистику
+        общего кэша (hits, misses, maxsize, currsize).
+        """
         return {
-            'cached_configs': list(self._cache.keys()),
-            'cache_size': len(self._cache)
+            'cached_configs': list(self._loaded),
+            'cache_size': len(self._loaded),
+            **_load_and_validate.cache_info()._asdict()
         } 
\ No newline at end of file
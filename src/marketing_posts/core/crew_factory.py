@@ -3,7 +3,8 @@
 Реализует паттерн Factory для создания crew.
 """
 
-from typing import Dict, Type
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple, Type
 from .base_crew import BaseCrew, CrewConfig
 from .config_manager import ConfigManager
 
@@ -25,6 +26,8 @@ class CrewFactory:
         """
         self.config_manager = config_manager
         self._crew_registry: Dict[str, Type[BaseCrew]] = {}
+        self._validation_cache: Dict[Tuple[str, CrewConfig], bool] = {}
+        self._crew_cache: Dict[Tuple[str, Tuple[Any, ...]], BaseCrew] = {}
     
     def register_crew_type(
         self, 
@@ -39,6 +42,8 @@ class CrewFactory:
             crew_class: Класс crew для регистрации
         """
         self._crew_registry[crew_type] = crew_class
+        self._validation_cache.clear()
+        self._crew_cache.clear()
     
     def create_crew(
         self, 
@@ -68,6 +73,41 @@ class CrewFactory:
         crew_class = self._crew_registry[crew_type]
         return crew_class(config)
     
+    def get_crew(
+        self, 
+        crew_type: str, 
+        config: CrewConfig
+    ) -> BaseCrew:
+        """
+        Возвращает crew указанного типа, создавая его при первом запросе.
+        
+        Crew кэшируется по типу и отпечатку конфигурации, поэтому
+        повторные запуски не перечитывают YAML и не собирают агентов
+        заново. Экземпляр хранит состояние задач, поэтому для
+        одновременных запусков нужен create_crew.
+        
+        Args:
+            crew_type: Тип crew
+            config: Конфигурация для crew
+            
+        Returns:
+            Настроенный экземпляр crew
+            
+        Raises:
+            ValueError: Если тип crew не зарегистрирован
+        """
+        cache_key = (crew_type, config.fingerprint())
+        crew = self._crew_cache.get(cache_key)
+        if crew is None:
+            crew = self._crew_cache[cache_key] = self.create_crew(
+                crew_type, config
+            )
+        return crew
+    
+    def clear_crew_cache(self) -> None:
+        """Очищает кэш созданных crew."""
+        self._crew_cache.clear()
+    
     def get_available_crew_types(self) -> list[str]:
         """Возвращает список доступных типов crew."""
         return list(self._crew_registry.keys())
@@ -90,14 +130,22 @@ class CrewFactory:
         if crew_type not in self._crew_registry:
             return False
         
+        # CrewConfig неизменяем, поэтому результат проверки можно кэшировать
+        cache_key = (crew_type, config)
+        if cache_key in self._validation_cache:
+            return self._validation_cache[cache_key]
+        
         crew_class = self._crew_registry[crew_type]
         
-        # Базовая валидация - проверяем, можно ли создать crew
+        # Статическая проверка: без создания LLM, загрузки YAML и сети
         try:
-            crew_class(config)
-            return True
-        except Exception:
-            return False
+            crew_class.validate_config(config)
+            is_valid = True
+        except ValueError:
+            is_valid = False
+        
+        self._validation_cache[cache_key] = is_valid
+        return is_valid
 
 
 class CrewBuilder:
@@ -107,53 +155,78 @@ class CrewBuilder:
     Предоставляет fluent интерфейс для построения конфигураций crew.
     """
     
-    def __init__(self):
-        """Инициализирует builder crew."""
-        self._config = CrewConfig()
+    # Готовые неизменяемые конфигурации, общие для всех вызовов
+    _STANDARD = CrewConfig(llm_provider="deepseek")
+    _GAMING = CrewConfig(
+        llm_provider="deepseek",
+        agents_config="config/agents_gaming.yaml",
+        tasks_config="config/tasks_gaming.yaml"
+    )
+    
+    def __init__(self, base: Optional[CrewConfig] = None):
+        """
+        Инициализирует builder crew.
+        
+        Args:
+            base: Исходная конфигурация (по умолчанию CrewConfig())
+        """
+        self._config = base if base is not None else CrewConfig()
     
     def with_llm_provider(self, provider: str) -> 'CrewBuilder':
         """Устанавливает провайдера LLM."""
-        self._config.llm_provider = provider
+        self._config = replace(self._config, llm_provider=provider)
         return self
     
     def with_llm_model(self, model: str) -> 'CrewBuilder':
         """Устанавливает модель LLM."""
-        self._config.llm_model = model
+        self._config = replace(self._config, llm_model=model)
         return self
     
     def with_agents_config(self, config_path: str) -> 'CrewBuilder':
         """Устанавливает путь к конфигурации агентов."""
-        self._config.agents_config = config_path
+        self._config = replace(self._config, agents_config=config_path)
         return self
     
     def with_tasks_config(self, config_path: str) -> 'CrewBuilder':
         """Устанавливает путь к конфигурации задач."""
-        self._config.tasks_config = config_path
+        self._config = replace(self._config, tasks_config=config_path)
         return self
     
     def with_verbose(self, verbose: bool) -> 'CrewBuilder':
         """Устанавливает режим verbose."""
-        self._config.verbose = verbose
+        self._config = replace(self._config, verbose=verbose)
         return self
     
     def with_memory(self, memory: bool) -> 'CrewBuilder':
         """Устанавливает режим памяти."""
-        self._config.memory = memory
+        self._config = replace(self._config, memory=memory)
+        return self
+    
+    def with_process(self, process: str) -> 'CrewBuilder':
+        """Устанавливает процесс выполнения (sequential/hierarchical)."""
+        self._config = replace(self._config, process=process)
         return self
     
     def build(self) -> CrewConfig:
         """Строит и возвращает конфигурацию crew."""
         return self._config
     
+    @classmethod
+    def standard_config(cls) -> CrewConfig:
+        """Возвращает стандартную конфигурацию."""
+        return cls._STANDARD
+    
+    @classmethod
+    def gaming_config(cls) -> CrewConfig:
+        """Возвращает игровую конфигурацию."""
+        return cls._GAMING
+    
     @classmethod
     def create_standard_config(cls) -> 'CrewBuilder':
         """Создает builder со стандартной конфигурацией."""
-        return cls().with_llm_provider("deepseek")
+        return cls(cls._STANDARD)
     
     @classmethod
     def create_gaming_config(cls) -> 'CrewBuilder':
         """Создает builder с игровой конфигурацией."""
-        return (cls()
-                .with_llm_provider("deepseek")
-                .with_agents_config("config/agents_gaming.yaml")
-                .with_tasks_config("config/tasks_gaming.yaml")) 
\ No newline at end of file
+        return cls(cls._GAMING) 
\ No newline at end of file
@@ -3,12 +3,188 @@
 Обрабатывает сохранение результатов в файлы с правильной кодировкой.
 """
 
-from datetime import datetime
+import errno
+import mmap
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Экранированные последовательности в выводе LLM и их замены
+_ESC_RE = re.compile(r"""\\[n"']""")
+_ESC_MAP = {'\\n': '\n', '\\"': '"', "\\'": "'"}
+
+# Строковое представление кортежа ('raw', '...')
+_RAW_PREFIX = "('raw', '"
+_RAW_SUFFIX = "')"
+_RAW_MIN_LEN = len(_RAW_PREFIX) + len(_RAW_SUFFIX)
+
+# Запасные атрибуты результата задачи в порядке приоритета
+_RESULT_ATTRS = ('result', 'output')
+_MISSING = object()
+
+
+# Статические части отчетов, закодированные один раз при загрузке модуля
+_RESULTS_TITLE = (
+    "# Результаты маркетинговой стратегии CrewAI\n\n".encode('utf-8')
+)
+_RESULTS_SECTION = "## Результаты выполнения задач\n\n".encode('utf-8')
+_OVERALL_HEADER = "### Общий результат\n\n".encode('utf-8')
+_RESULT_LABEL = "**Результат:**\n\n".encode('utf-8')
+_TASK_SEPARATOR = b"---\n\n"
+_PARAGRAPH_END = b"\n\n"
+_CONFIG_HEADER = "# Информация о конфигурации\n\n".encode('utf-8')
+_ERROR_HEADER = "# Отчет об ошибке выполнения\n\n".encode('utf-8')
+_ERROR_FOOTER = (
+    "## Рекомендации:\n"
+    "1. Проверьте логи выше\n"
+    "2. Попробуйте запустить снова\n"
+    "3. Обратитесь к разработчику\n"
+).encode('utf-8')
+
+# Флаги для записи файла результатов напрямую через дескриптор
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+)
+
+# Максимум буферов в одном вызове writev()
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+# Объем накопленных фрагментов, после которого они сбрасываются в файл
+_FLUSH_SIZE = 1 << 20
+
+# Прямой ввод-вывод (O_DIRECT) для больших файлов, включается MP_DIRECT_IO=1
+_DIRECT_IO_MIN_SIZE = 64 * 1024
+_DIRECT_IO_ALIGN = 4096
+
+
+def _direct_write(file_path: Path, data: bytes) -> None:
+    """
+    Записывает данные в файл с O_DIRECT, минуя страничный кэш ядра.
+    
+    Данные копируются в выровненный буфер mmap с размером, кратным
+    4096 байтам, после чего лишний хвост обрезается до реальной длины.
+    """
+    size = len(data)
+    aligned = -(-size // _DIRECT_IO_ALIGN) * _DIRECT_IO_ALIGN
+    with mmap.mmap(-1, aligned) as buf:
+        buf[:size] = data
+        fd = os.open(
+            file_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT,
+            0o644
+        )
+        # Срез memoryview не копирует данные и сохраняет выравнивание
+        # буфера; срез самого mmap дал бы невыровненную копию (EINVAL)
+        try:
+            with memoryview(buf) as view:
+                offset = 0
+                while offset < aligned:
+                    offset += os.pwrite(fd, view[offset:aligned], offset)
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+
+def _writev_all(fd: int, chunks: List[bytes]) -> None:
+    """
+    Записывает фрагменты через writev() без склейки в один буфер.
+    
+    Фрагменты отправляются пачками не больше IOV_MAX; при частичной
+    записи полностью записанные буферы отбрасываются, а недописанный
+    укорачивается.
+    """
+    pending = [memoryview(chunk) for chunk in chunks if chunk]
+    while pending:
+        written = os.writev(fd, pending[:_IOV_MAX])
+        done = 0
+        while done < len(pending) and written >= len(pending[done]):
+            written -= len(pending[done])
+            done += 1
+        if written:
+            pending[done] = pending[done][written:]
+        del pending[:done]
+
+
+def _flush_chunks(fd: int, chunks: List[bytes]) -> None:
+    """Записывает пачку фрагментов одним writev() или одним write()."""
+    if hasattr(os, 'writev'):
+        _writev_all(fd, chunks)
+    else:
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+
+
+def _write_file(file_path: Path, chunks: Iterable[bytes]) -> None:
+    """
+    Записывает готовые фрагменты в файл через низкоуровневый дескриптор.
+    
+    Фрагменты передаются ядру вызовами writev() без буферов текстового
+    ввода-вывода Python и без промежуточной склейки. Фрагменты могут
+    поступать из генератора: они сбрасываются пачками по _FLUSH_SIZE,
+    поэтому в памяти не держится весь файл целиком. Обычный отчет
+    укладывается в одну пачку и пишется одним вызовом.
+    Большие файлы при MP_DIRECT_IO=1 пишутся через O_DIRECT.
+    """
+    if hasattr(os, 'O_DIRECT') and os.environ.get('MP_DIRECT_IO') == '1':
+        # O_DIRECT требует весь файл в одном выровненном буфере
+        chunks = list(chunks)
+        if sum(map(len, chunks)) >= _DIRECT_IO_MIN_SIZE:
+            try:
+                _direct_write(file_path, b"".join(chunks))
+                return
+            except OSError as e:
+                # Файловая система не поддерживает O_DIRECT
+                if e.errno != errno.EINVAL:
+                    raise
+    
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        pending: List[bytes] = []
+        pending_size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= _FLUSH_SIZE or len(pending) >= _IOV_MAX:
+                _flush_chunks(fd, pending)
+                pending = []
+                pending_size = 0
+        if pending:
+            _flush_chunks(fd, pending)
+    finally:
+        os.close(fd)
+
+
+def _now_str(now: Optional[time.struct_time] = None) -> Tuple[str, str]:
+    """
+    Возвращает метки времени для одной операции сохранения.
+    
+    Args:
+        now: Момент времени; по умолчанию текущее локальное время
+    
+    Returns:
+        Кортеж (метка для имени файла, читаемая дата) от одного
+        чтения часов
+    """
+    if now is None:
+        now = time.localtime()
+    return (
+        time.strftime("%Y%m%d_%H%M%S", now),
+        time.strftime('%Y-%m-%d %H:%M:%S', now)
+    )
+
+
 @dataclass
 class SaveResult:
     """Результат операции сохранения."""
@@ -23,14 +199,18 @@ class ResultFormatter:
     @staticmethod
     def format_task_result(task_result: Any) -> str:
         """Форматирует результат одной задачи для вывода."""
-        if hasattr(task_result, 'raw') and task_result.raw:
-            return str(task_result.raw)
-        elif hasattr(task_result, 'result'):
-            return str(task_result.result)
-        elif hasattr(task_result, 'output'):
-            return str(task_result.output)
-        else:
-            return str(task_result)
+        raw = getattr(task_result, 'raw', None)
+        if raw:
+            return str(raw)
+        
+        # getattr с значением по умолчанию не поднимает AttributeError
+        # на уровне Python при отсутствии атрибута
+        for name in _RESULT_ATTRS:
+            value = getattr(task_result, name, _MISSING)
+            if value is not _MISSING:
+                return str(value)
+        
+        return str(task_result)
     
     @staticmethod
     def clean_text(text: str) -> str:
@@ -38,18 +218,24 @@ class ResultFormatter:
         if not isinstance(text, str):
             return str(text)
         
-        # Удаляем escape-последовательности
-        text = text.replace('\\n', '\n')
-        text = text.replace('\\"', '"')
-        text = text.replace("\\'", "'")
+        # Чистый текст без экранирования и кортежа возвращаем как есть
+        if '\\' not in text and not text.startswith(_RAW_PREFIX):
+            return text
+        
+        # Удаляем escape-последовательности за один проход
+        text = _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], text)
         
-        # Обрабатываем результаты-кортежи
-        if text.startswith("('raw', '") and text.endswith("')"):
-            start_idx = text.find("('raw', '") + 9
-            end_idx = text.rfind("')")
-            if start_idx > 8 and end_idx > start_idx:
-                text = text[start_idx:end_idx]
-                # Безопасное декодирование Unicode
+        # Обрабатываем результаты-кортежи: границы известны, поэтому
+        # содержимое вырезается срезом без повторного сканирования
+        if (
+            len(text) > _RAW_MIN_LEN
+            and text.startswith(_RAW_PREFIX)
+            and text.endswith(_RAW_SUFFIX)
+        ):
+            text = text[len(_RAW_PREFIX):-len(_RAW_SUFFIX)]
+            # Безопасное декодирование Unicode; без обратных слэшей
+            # декодировать нечего, и две копии строки не создаются
+            if '\\' in text:
                 try:
                     text = text.encode('latin-1').decode('unicode_escape')
                 except (UnicodeDecodeError, UnicodeEncodeError):
@@ -66,6 +252,11 @@ class ResultSaver:
     с правильной кодировкой и обработкой ошибок.
     """
     
+    # Общий пул для параллельной записи независимых файлов
+    _pool = ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix='result-saver'
+    )
+    
     def __init__(self, base_dir: str = "results"):
         """
         Инициализирует сохранитель результатов.
@@ -75,31 +266,47 @@ class ResultSaver:
         """
         self.base_dir = Path(base_dir)
         self.formatter = ResultFormatter()
+        # Последняя созданная директория: (метка времени, путь)
+        self._last_results_dir: Optional[Tuple[str, str]] = None
     
-    def create_results_directory(self) -> str:
+    def create_results_directory(
+        self,
+        now: Optional[time.struct_time] = None
+    ) -> str:
         """
         Создает директорию результатов с временной меткой.
         
+        Повторный запрос в ту же секунду (например, отчет об ошибке
+        после сохранения результатов) возвращает уже созданную
+        директорию без обращения к файловой системе.
+        
+        Args:
+            now: Момент времени для метки (по умолчанию текущий)
+            
         Returns:
             Путь к созданной директории
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        results_dir = self.base_dir / f"results_{timestamp}"
+        if now is None:
+            now = time.localtime()
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", now)
         
-        # Создаем базовую директорию, если она не существует
-        if not self.base_dir.exists():
-            self.base_dir.mkdir(parents=True)
+        last = self._last_results_dir
+        if last is not None and last[0] == timestamp:
+            return last[1]
         
-        # Создаем директорию с временной меткой
-        if not results_dir.exists():
-            results_dir.mkdir(parents=True)
+        results_dir = self.base_dir / f"results_{timestamp}"
+        
+        # Создаем директорию вместе с базовой одним вызовом mkdir
+        results_dir.mkdir(parents=True, exist_ok=True)
         
+        self._last_results_dir = (timestamp, str(results_dir))
         return str(results_dir)
     
     def save_marketing_results(
         self, 
         results: Any, 
-        results_dir: Optional[str] = None
+        results_dir: Optional[str] = None,
+        now: Optional[time.struct_time] = None
     ) -> SaveResult:
         """
         Сохраняет результаты маркетинговой стратегии в markdown файл.
@@ -107,21 +314,27 @@ class ResultSaver:
         Args:
             results: Результаты выполнения crew
             results_dir: Директория для сохранения результатов
+            now: Момент времени для меток (по умолчанию текущий)
             
         Returns:
             SaveResult с статусом операции
         """
         try:
+            if now is None:
+                now = time.localtime()
             if results_dir is None:
-                results_dir = self.create_results_directory()
+                results_dir = self.create_results_directory(now)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp, current_time = _now_str(now)
             filename = f"marketing_strategy_results_{timestamp}.md"
             file_path = Path(results_dir) / filename
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                self._write_results_header(f)
-                self._write_results_content(f, results)
+            # Фрагменты генерируются по мере записи: в памяти не больше
+            # одной пачки и текста одной задачи
+            _write_file(
+                file_path,
+                self._iter_results_chunks(results, current_time)
+            )
             
             return SaveResult(
                 success=True,
@@ -138,7 +351,8 @@ class ResultSaver:
     def save_config_info(
         self, 
         config_info: Dict[str, Any], 
-        results_dir: str
+        results_dir: str,
+        now: Optional[time.struct_time] = None
     ) -> SaveResult:
         """
         Сохраняет информацию о конфигурации в markdown файл.
@@ -146,20 +360,23 @@ class ResultSaver:
         Args:
             config_info: Информация о конфигурации для сохранения
             results_dir: Директория для сохранения файла
+            now: Момент времени для меток (по умолчанию текущий)
             
         Returns:
             SaveResult с статусом операции
         """
         try:
             file_path = Path(results_dir) / "config_info.md"
+            _, current_time = _now_str(now)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("# Информация о конфигурации\n\n")
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                f.write(f"**Дата запуска:** {current_time}\n\n")
-                
-                for key, value in config_info.items():
-                    f.write(f"**{key}:** {value}\n")
+            parts = [f"**Дата запуска:** {current_time}\n\n"]
+            parts.extend(
+                f"**{key}:** {value}\n" for key, value in config_info.items()
+            )
+            _write_file(
+                file_path,
+                [_CONFIG_HEADER, "".join(parts).encode('utf-8')]
+            )
             
             return SaveResult(
                 success=True,
@@ -177,7 +394,8 @@ class ResultSaver:
         self, 
         error_msg: str, 
         results_dir: Optional[str] = None,
-        config_type: str = "Стандартная"
+        config_type: str = "Стандартная",
+        now: Optional[time.struct_time] = None
     ) -> SaveResult:
         """
         Сохраняет отчет об ошибке в markdown файл.
@@ -186,28 +404,30 @@ class ResultSaver:
             error_msg: Сообщение об ошибке для сохранения
             results_dir: Директория для сохранения файла
             config_type: Тип конфигурации, которая не сработала
+            now: Момент времени для меток (по умолчанию текущий)
             
         Returns:
             SaveResult с статусом операции
         """
         try:
+            if now is None:
+                now = time.localtime()
             if results_dir is None:
-                results_dir = self.create_results_directory()
+                results_dir = self.create_results_directory(now)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp, current_time = _now_str(now)
             filename = f"error_report_{timestamp}.md"
             file_path = Path(results_dir) / filename
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("# Отчет об ошибке выполнения\n\n")
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                f.write(f"**Дата:** {current_time}\n")
-                f.write(f"**Ошибка:** {error_msg}\n")
-                f.write(f"**Конфигурация:** {config_type}\n\n")
-                f.write("## Рекомендации:\n")
-                f.write("1. Проверьте логи выше\n")
-                f.write("2. Попробуйте запустить снова\n")
-                f.write("3. Обратитесь к разработчику\n")
+            details = (
+                f"**Дата:** {current_time}\n"
+                f"**Ошибка:** {error_msg}\n"
+                f"**Конфигурация:** {config_type}\n\n"
+            )
+            _write_file(
+                file_path,
+                [_ERROR_HEADER, details.encode('utf-8'), _ERROR_FOOTER]
+            )
             
             return SaveResult(
                 success=True,
@@ -221,51 +441,145 @@ class ResultSaver:
                 error_message=str(e)
             )
     
-    def _write_results_header(self, file_handle) -> None:
-        """Записывает заголовочную секцию файла результатов."""
-        file_handle.write("# Результаты маркетинговой стратегии CrewAI\n\n")
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        file_handle.write(f"**Дата создания:** {current_time}\n\n")
-        file_handle.write("## Результаты выполнения задач\n\n")
+    def save_all(
+        self,
+        results: Any,
+        config_info: Dict[str, Any],
+        results_dir: Optional[str] = None,
+        error_msg: Optional[str] = None
+    ) -> Dict[str, SaveResult]:
+        """
+        Сохраняет результаты, конфигурацию и отчет об ошибке параллельно.
+        
+        Файлы независимы, поэтому записываются одновременно в общем
+        пуле потоков. Часы читаются один раз: директория и все файлы
+        получают одинаковую метку времени.
+        
+        Args:
+            results: Результаты выполнения crew
+            config_info: Информация о конфигурации для сохранения
+            results_dir: Директория для сохранения файлов
+            error_msg: Сообщение об ошибке (отчет пишется, если задано)
+            
+        Returns:
+            Словарь SaveResult по ключам 'results', 'config' и 'error'
+        """
+        now = time.localtime()
+        if results_dir is None:
+            results_dir = self.create_results_directory(now)
+        
+        futures = {
+            self._pool.submit(
+                self.save_marketing_results, results, results_dir, now
+            ): 'results',
+            self._pool.submit(
+                self.save_config_info, config_info, results_dir, now
+            ): 'config',
+        }
+        if error_msg is not None:
+            futures[self._pool.submit(
+                self.save_error_report, error_msg, results_dir, now=now
+            )] = 'error'
+        
+        return {
+            futures[future]: future.result()
+            for future in as_completed(futures)
+        }
+    
+    async def save_all_async(
+        self,
+        results: Any,
+        config_info: Dict[str, Any],
+        results_dir: Optional[str] = None,
+        error_msg: Optional[str] = None
+    ) -> Dict[str, SaveResult]:
+        """
+        Асинхронный вариант save_all, не блокирующий цикл событий.
+        
+        Блокирующие записи выполняются в потоках через asyncio.to_thread,
+        поэтому сохранения нескольких crew в пакете перекрываются.
+        
+        Args:
+            results: Результаты выполнения crew
+            config_info: Информация о конфигурации для сохранения
+            results_dir: Директория для сохранения файлов
+            error_msg: Сообщение об ошибке (отчет пишется, если задано)
+            
+        Returns:
+            Словарь SaveResult по ключам 'results', 'config' и 'error'
+        """
+        import asyncio
+        
+        now = time.localtime()
+        if results_dir is None:
+            results_dir = await asyncio.to_thread(
+                self.create_results_directory, now
+            )
+        
+        jobs = {
+            'results': asyncio.to_thread(
+                self.save_marketing_results, results, results_dir, now
+            ),
+            'config': asyncio.to_thread(
+                self.save_config_info, config_info, results_dir, now
+            ),
+        }
+        if error_msg is not None:
+            jobs['error'] = asyncio.to_thread(
+                self.save_error_report, error_msg, results_dir, now=now
+            )
+        
+        saved = await asyncio.gather(*jobs.values())
+        return dict(zip(jobs, saved))
     
-    def _write_results_content(self, file_handle, results: Any) -> None:
-        """Записывает основное содержимое файла результатов."""
+    def _iter_results_chunks(
+        self,
+        results: Any,
+        current_time: str
+    ) -> Iterator[bytes]:
+        """Выдает фрагменты файла результатов: заголовок и содержимое."""
+        yield _RESULTS_TITLE
+        yield f"**Дата создания:** {current_time}\n\n".encode('utf-8')
+        yield _RESULTS_SECTION
+        
         if hasattr(results, '__iter__') and not isinstance(results, str):
             for i, task_result in enumerate(results, 1):
-                self._write_task_result(file_handle, i, task_result)
+                yield from self._iter_task_chunks(i, task_result)
         else:
-            file_handle.write("### Общий результат\n\n")
-            formatted_result = self.formatter.clean_text(str(results))
-            file_handle.write(f"{formatted_result}\n\n")
+            yield _OVERALL_HEADER
+            formatted_result = self.formatter.clean_text(results)
+            yield formatted_result.encode('utf-8')
+            yield _PARAGRAPH_END
     
-    def _write_task_result(
+    def _iter_task_chunks(
         self, 
-        file_handle, 
         task_num: int, 
         task_result: Any
-    ) -> None:
-        """Записывает результат одной задачи в файл."""
-        file_handle.write(f"### Задача {task_num}\n\n")
-        
+    ) -> Iterator[bytes]:
+        """Выдает фрагменты результата одной задачи."""
         # Получаем имя агента
         agent_name = "Неизвестно"
-        if hasattr(task_result, 'agent') and task_result.agent:
-            agent_name = getattr(task_result.agent, 'name', 'Неизвестно')
+        agent = getattr(task_result, 'agent', None)
+        if agent:
+            agent_name = getattr(agent, 'name', 'Неизвестно')
             if isinstance(agent_name, str):
                 agent_name = agent_name.strip().replace('\n', ' ')
         
-        file_handle.write(f"**Агент:** {agent_name}\n\n")
-        
         # Получаем имя задачи
-        task_name = "Неизвестно"
-        if hasattr(task_result, 'name') and task_result.name:
-            task_name = task_result.name
+        task_name = getattr(task_result, 'name', None) or "Неизвестно"
         
-        file_handle.write(f"**Задача:** {task_name}\n\n")
-        file_handle.write("**Результат:**\n\n")
+        yield (
+            f"### Задача {task_num}\n\n"
+            f"**Агент:** {agent_name}\n\n"
+            f"**Задача:** {task_name}\n\n"
+        ).encode('utf-8')
+        yield _RESULT_LABEL
         
         # Форматируем и записываем результат
         formatted_result = self.formatter.format_task_result(task_result)
         cleaned_result = self.formatter.clean_text(formatted_result)
-        file_handle.write(f"{cleaned_result}\n\n")
-        file_handle.write("---\n\n") 
\ No newline at end of file
+        # Длинный текст кодируется сам по себе, без склейки с "\n\n":
+        # writev() передаст фрагменты ядру без лишней копии
+        yield cleaned_result.encode('utf-8')
+        yield _PARAGRAPH_END
+        yield _TASK_SEPARATOR 
\ No newline at end of file
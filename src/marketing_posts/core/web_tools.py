@@ -3,15 +3,104 @@
 Использует Serper API для поиска и анализа веб-контента.
 """
 
+import functools
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from langchain.tools import tool
-from dotenv import load_dotenv
 
-# Загружаем переменные окружения
-load_dotenv()
+_SERPER_URL = "https://google.serper.dev/search"
+
+# Для анализа страницы загружается только начало документа
+_PAGE_PREFIX_BYTES = 8192
+_PAGE_RANGE_HEADERS = {'Range': f'bytes=0-{_PAGE_PREFIX_BYTES - 1}'}
+
+# Шаблоны запросов по платформам; остальные платформы - шаблон по умолчанию
+_TRENDS_TEMPLATES = {
+    "telegram": "тренды {topic} telegram каналы",
+    "discord": "тренды {topic} discord серверы",
+}
+_TRENDS_DEFAULT = "тренды {topic} 2024"
+
+_STRATEGIES_TEMPLATES = {
+    "telegram": "маркетинг {industry} telegram стратегии",
+    "discord": "маркетинг {industry} discord стратегии",
+}
+_STRATEGIES_DEFAULT = "маркетинговые стратегии {industry} 2024"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """
+    Возвращает общую HTTP-сессию всех веб-инструментов.
+    
+    Один пул keep-alive соединений на процесс: TLS-рукопожатие
+    с каждым хостом выполняется один раз для всех агентов.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def _serper_headers(api_key: str) -> Dict[str, str]:
+    """
+    Возвращает заголовки запроса к Serper API.
+    
+    Ключ передается в каждом запросе, а не в общей сессии, чтобы он
+    не уходил на сторонние сайты при анализе страниц.
+    """
+    return {
+        'X-API-KEY': api_key,
+        'content-type': 'application/json'
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _perform_search_cached(
+    api_key: str,
+    query: str,
+    num_results: int
+) -> str:
+    """
+    Выполняет поиск через Serper API и кэширует отформатированный ответ.
+    
+    Исключения пробрасываются вызывающему, поэтому ошибки не кэшируются.
+    """
+    payload = b'{"q":%s,"num":%d}' % (
+        json.dumps(query, ensure_ascii=False).encode('utf-8'),
+        num_results
+    )
+    
+    response = _get_session().post(
+        _SERPER_URL,
+        headers=_serper_headers(api_key),
+        data=payload,
+        timeout=10
+    )
+    response.raise_for_status()
+    
+    data = response.json()
+    organic_results = data.get('organic', [])
+    
+    if not organic_results:
+        return f"По запросу '{query}' ничего не найдено."
+    
+    results = [
+        f"Результат {i}:\n"
+        f"Заголовок: {result.get('title', 'Нет заголовка')}\n"
+        f"Ссылка: {result.get('link', 'Нет ссылки')}\n"
+        f"Описание: {result.get('snippet', 'Нет описания')}\n"
+        "-----------------"
+        for i, result in enumerate(organic_results[:num_results], 1)
+    ]
+    
+    content = '\n'.join(results)
+    return f"Результаты поиска по запросу '{query}':\n\n{content}"
 
 
 class WebSearchTools:
@@ -102,13 +191,9 @@ class WebSearchTools:
         Returns:
             Актуальные тренды по теме
         """
-        if platform == "telegram":
-            query = f"тренды {topic} telegram каналы"
-        elif platform == "discord":
-            query = f"тренды {topic} discord серверы"
-        else:
-            query = f"тренды {topic} 2024"
-        
+        query = _TRENDS_TEMPLATES.get(platform, _TRENDS_DEFAULT).format(
+            topic=topic
+        )
         return self._perform_search(query, num_results=5)
     
     @tool("Анализ аудитории")
@@ -141,13 +226,9 @@ class WebSearchTools:
         Returns:
             Эффективные маркетинговые стратегии
         """
-        if platform == "telegram":
-            query = f"маркетинг {industry} telegram стратегии"
-        elif platform == "discord":
-            query = f"маркетинг {industry} discord стратегии"
-        else:
-            query = f"маркетинговые стратегии {industry} 2024"
-        
+        query = _STRATEGIES_TEMPLATES.get(
+            platform, _STRATEGIES_DEFAULT
+        ).format(industry=industry)
         return self._perform_search(query, num_results=5)
     
     @tool("Исследование игровой индустрии")
@@ -186,6 +267,8 @@ class WebSearchTools:
         """
         Выполняет поиск через Serper API.
         
+        Повторные запросы с теми же параметрами отдаются из кэша.
+        
         Args:
             query: Поисковый запрос
             num_results: Количество результатов
@@ -194,39 +277,9 @@ class WebSearchTools:
             Структурированные результаты поиска
         """
         try:
-            url = "https://google.serper.dev/search"
-            payload = json.dumps({"q": query, "num": num_results})
-            headers = {
-                'X-API-KEY': self.serper_api_key,
-                'content-type': 'application/json'
-            }
-            
-            response = requests.post(url, headers=headers, data=payload)
-            response.raise_for_status()
-            
-            data = response.json()
-            organic_results = data.get('organic', [])
-            
-            if not organic_results:
-                return f"По запросу '{query}' ничего не найдено."
-            
-            results = []
-            for i, result in enumerate(organic_results[:num_results], 1):
-                try:
-                    result_text = '\n'.join([
-                        f"Результат {i}:",
-                        f"Заголовок: {result.get('title', 'Нет заголовка')}",
-                        f"Ссылка: {result.get('link', 'Нет ссылки')}",
-                        f"Описание: {result.get('snippet', 'Нет описания')}",
-                        "-----------------"
-                    ])
-                    results.append(result_text)
-                except KeyError:
-                    continue
-            
-            content = '\n'.join(results)
-            return f"Результаты поиска по запросу '{query}':\n\n{content}"
-            
+            return _perform_search_cached(
+                self.serper_api_key, query, num_results
+            )
         except requests.exceptions.RequestException as e:
             return f"Ошибка при выполнении поиска: {str(e)}"
         except Exception as e:
@@ -255,19 +308,18 @@ class WebAnalysisTools:
             Структурированный анализ страницы
         """
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
+            status_code, page_size, encoding, prefix = self._fetch_prefix(url)
             
             # Простой анализ HTML (можно расширить)
-            content = response.text[:2000]  # Первые 2000 символов
+            content = prefix[:2000]  # Первые 2000 символов
             
             return f"""
 Анализ страницы: {url}
 
 Основная информация:
-- Статус: {response.status_code}
-- Размер контента: {len(response.text)} символов
-- Кодировка: {response.encoding}
+- Статус: {status_code}
+- Размер страницы в байтах: {page_size}
+- Кодировка: {encoding}
 
 Начало контента:
 {content}...
@@ -279,16 +331,89 @@ class WebAnalysisTools:
             return f"Ошибка при анализе страницы {url}: {str(e)}"
         except Exception as e:
             return f"Неожиданная ошибка при анализе: {str(e)}"
+    
+    def _fetch_prefix(self, url: str) -> Tuple[int, str, str, str]:
+        """
+        Загружает только начало страницы.
+        
+        Запрашивает первые 8 КиБ через заголовок Range и читает
+        не больше этого объема, даже если сервер игнорирует Range
+        и отвечает 200 со всем документом.
+        
+        Args:
+            url: URL страницы
+            
+        Returns:
+            Статус ответа, размер страницы в байтах, кодировку и начало
+            текста
+        """
+        session = _get_session()
+        response = session.get(
+            url, headers=_PAGE_RANGE_HEADERS, stream=True, timeout=10
+        )
+        if response.status_code == 416:
+            # Пустой документ: диапазон неудовлетворим, повторяем без Range
+            response.close()
+            response = session.get(url, stream=True, timeout=10)
+        
+        with response:
+            response.raise_for_status()
+            data = response.raw.read(_PAGE_PREFIX_BYTES, decode_content=True)
+            
+            # Полный размер в байтах (не в символах: тело целиком не
+            # декодируется): из Content-Range для 206, иначе Content-Length
+            total = response.headers.get('Content-Range', '').rpartition('/')
+            if total[2].isdigit():
+                page_size = total[2]
+            elif response.status_code == 200 and (
+                response.headers.get('Content-Length', '').isdigit()
+            ):
+                page_size = response.headers['Content-Length']
+            else:
+                page_size = "неизвестно"
+            
+            encoding = response.encoding or 'utf-8'
+            text = data.decode(encoding, 'replace')
+            return response.status_code, page_size, encoding, text
+
+
+@functools.lru_cache(maxsize=1)
+def get_web_search_tools() -> WebSearchTools:
+    """
+    Возвращает общий экземпляр инструментов поиска.
+    
+    Создается при первом обращении, поэтому проверка SERPER_API_KEY
+    не выполняется при простом импорте модуля.
+    """
+    return WebSearchTools()
+
+
+@functools.lru_cache(maxsize=1)
+def get_web_analysis_tools() -> WebAnalysisTools:
+    """Возвращает общий экземпляр инструментов анализа страниц."""
+    return WebAnalysisTools()
+
+
+_LAZY_INSTANCES = {
+    'web_search_tools': get_web_search_tools,
+    'web_analysis_tools': get_web_analysis_tools,
+}
+
 
+def __getattr__(name: str) -> Any:
+    """Лениво отдает прежние модульные экземпляры инструментов."""
+    try:
+        return _LAZY_INSTANCES[name]()
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
 
-# Создаем экземпляры инструментов
-web_search_tools = WebSearchTools()
-web_analysis_tools = WebAnalysisTools()
 
 # Экспортируем инструменты для использования в агентах
 __all__ = [
     'WebSearchTools',
     'WebAnalysisTools',
-    'web_search_tools',
-    'web_analysis_tools'
+    'get_web_search_tools',
+    'get_web_analysis_tools'
 ] 
\ No newline at end of file
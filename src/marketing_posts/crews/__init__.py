@@ -1,11 +1,39 @@
 """
 Конкретные реализации crew для системы маркетинговых постов.
+
+Модули crew импортируются при первом обращении к классу: они тянут
+crewai, langchain и веб-инструменты, которые не нужны, например,
+для вывода справки CLI.
 """
 
-from .standard_crew import StandardCrew
-from .gaming_crew import GamingCrew
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .standard_crew import StandardCrew
+    from .gaming_crew import GamingCrew
+
+_LAZY_CLASSES = {
+    'StandardCrew': '.standard_crew',
+    'GamingCrew': '.gaming_crew'
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Лениво импортирует классы crew при первом обращении."""
+    try:
+        module_name = _LAZY_CLASSES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'StandardCrew',
     'GamingCrew'
-] 
\ No newline at end of file
+]
\ No newline at end of file
@@ -2,11 +2,95 @@
 Игровая реализация crew для маркетинга игровых проектов.
 """
 
-from typing import List
+import logging
+from typing import Dict, List
 from crewai import Agent, Task
-from marketing_posts.core.base_crew import BaseCrew
+from marketing_posts.core.base_crew import (
+    AGENT_FIELDS,
+    TASK_FIELDS,
+    BaseCrew,
+    CrewConfig,
+    crew_component,
+    merge_defaults
+)
 from marketing_posts.core.config_manager import ConfigManager
-from marketing_posts.core.web_tools import web_search_tools, web_analysis_tools
+from marketing_posts.core.web_tools import (
+    get_web_analysis_tools,
+    get_web_search_tools
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Значения по умолчанию для полей, отсутствующих в YAML
+_AGENT_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'gaming_market_analyst': {
+        'role': 'Игровой аналитик рынка',
+        'goal': 'Анализ игрового рынка',
+        'backstory': 'Эксперт по игровой индустрии'
+    },
+    'gaming_strategist': {
+        'role': 'Игровой стратег',
+        'goal': 'Разработка игровых стратегий',
+        'backstory': 'Стратег игровой индустрии'
+    },
+    'content_creator_gaming': {
+        'role': 'Создатель игрового контента',
+        'goal': 'Создание игрового контента',
+        'backstory': 'Креативщик игровой индустрии'
+    },
+    'community_manager': {
+        'role': 'Менеджер сообщества',
+        'goal': 'Управление игровым сообществом',
+        'backstory': 'Эксперт по сообществам'
+    },
+    'legal_compliance_specialist': {
+        'role': 'Юридический специалист',
+        'goal': 'Правовое соответствие',
+        'backstory': 'Юрист игровой индустрии'
+    },
+    'technical_marketing_specialist': {
+        'role': 'Технический маркетолог',
+        'goal': 'Технический маркетинг',
+        'backstory': 'Технолог маркетинга'
+    }
+}
+
+_TASK_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'gaming_market_research_task': {
+        'description': 'Исследуйте игровой рынок',
+        'expected_output': 'Анализ игрового рынка'
+    },
+    'gaming_audience_analysis_task': {
+        'description': 'Проанализируйте аудиторию',
+        'expected_output': 'Анализ аудитории'
+    },
+    'gaming_legal_risk_assessment_task': {
+        'description': 'Оцените правовые риски',
+        'expected_output': 'Оценка рисков'
+    },
+    'gaming_community_strategy_task': {
+        'description': 'Разработайте стратегию сообщества',
+        'expected_output': 'Стратегия сообщества'
+    },
+    'gaming_marketing_strategy_task': {
+        'description': 'Разработайте игровую стратегию',
+        'expected_output': 'Игровая стратегия'
+    },
+    'gaming_content_creation_task': {
+        'description': 'Создайте игровой контент',
+        'expected_output': 'Игровой контент'
+    },
+    'gaming_technical_positioning_task': {
+        'description': 'Позиционируйте технически',
+        'expected_output': 'Техническое позиционирование'
+    },
+    'gaming_campaign_execution_task': {
+        'description': 'Выполните игровую кампанию',
+        'expected_output': 'Исполнение кампании'
+    }
+}
 
 
 class GamingCrew(BaseCrew):
@@ -17,9 +101,19 @@ class GamingCrew(BaseCrew):
     маркетинговых стратегий для игровой индустрии.
     """
     
-    def _validate_config(self) -> None:
+    __slots__ = (
+        'config_manager',
+        '_agents_cfg',
+        '_tasks_cfg',
+        'search_tools',
+        'analysis_tools'
+    )
+    
+    @classmethod
+    def validate_config(cls, config: CrewConfig) -> None:
         """Валидирует конфигурацию игрового crew."""
-        if not self.config.agents_config or not self.config.tasks_config:
+        super().validate_config(config)
+        if not config.agents_config or not config.tasks_config:
             raise ValueError(
                 "Необходимо указать пути к конфигурациям агентов и задач"
             )
@@ -27,295 +121,257 @@ class GamingCrew(BaseCrew):
     def _initialize_crew(self) -> None:
         """Инициализирует компоненты игрового crew."""
         self.config_manager = ConfigManager()
-        print("🎮 Используются игровые агенты и задачи")
+        # Конфигурации читаются и дополняются значениями по умолчанию
+        # один раз на экземпляр crew
+        self._agents_cfg = merge_defaults(
+            self.config_manager.get_agents_config("agents_gaming.yaml"),
+            _AGENT_DEFAULTS
+        )
+        self._tasks_cfg = merge_defaults(
+            self.config_manager.get_tasks_config("tasks_gaming.yaml"),
+            _TASK_DEFAULTS
+        )
+        self.search_tools = get_web_search_tools()
+        self.analysis_tools = get_web_analysis_tools()
+        logger.debug("Используются игровые агенты и задачи")
     
+    @crew_component
     def gaming_market_analyst(self) -> Agent:
         """Игровой аналитик рынка."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['gaming_market_analyst']
         )
-        analyst_config = agents_config.get('gaming_market_analyst', {})
         
         return Agent(
-            role=analyst_config.get('role', 'Игровой аналитик рынка'),
-            goal=analyst_config.get('goal', 'Анализ игрового рынка'),
-            backstory=analyst_config.get(
-                'backstory', 'Эксперт по игровой индустрии'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.research_gaming_industry,
-                web_search_tools.analyze_market,
-                web_search_tools.search_competitors,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.research_gaming_industry,
+                self.search_tools.analyze_market,
+                self.search_tools.search_competitors,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def gaming_strategist(self) -> Agent:
         """Игровой стратег."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['gaming_strategist']
         )
-        strategist_config = agents_config.get('gaming_strategist', {})
         
         return Agent(
-            role=strategist_config.get('role', 'Игровой стратег'),
-            goal=strategist_config.get('goal', 'Разработка игровых стратегий'),
-            backstory=strategist_config.get(
-                'backstory', 'Стратег игровой индустрии'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_marketing_strategies,
-                web_search_tools.search_trends,
-                web_search_tools.research_gaming_industry,
-                web_search_tools.analyze_audience
+                self.search_tools.search_marketing_strategies,
+                self.search_tools.search_trends,
+                self.search_tools.research_gaming_industry,
+                self.search_tools.analyze_audience
             ]
         )
     
+    @crew_component
     def content_creator_gaming(self) -> Agent:
         """Создатель игрового контента."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['content_creator_gaming']
         )
-        creator_config = agents_config.get('content_creator_gaming', {})
         
         return Agent(
-            role=creator_config.get('role', 'Создатель игрового контента'),
-            goal=creator_config.get('goal', 'Создание игрового контента'),
-            backstory=creator_config.get(
-                'backstory', 'Креативщик игровой индустрии'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_trends,
-                web_search_tools.research_product,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.search_trends,
+                self.search_tools.research_product,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def community_manager(self) -> Agent:
         """Менеджер сообщества."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['community_manager']
         )
-        manager_config = agents_config.get('community_manager', {})
         
         return Agent(
-            role=manager_config.get('role', 'Менеджер сообщества'),
-            goal=manager_config.get(
-                'goal', 'Управление игровым сообществом'
-            ),
-            backstory=manager_config.get(
-                'backstory', 'Эксперт по сообществам'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_trends,
-                web_search_tools.analyze_audience,
-                web_search_tools.search_internet
+                self.search_tools.search_trends,
+                self.search_tools.analyze_audience,
+                self.search_tools.search_internet
             ]
         )
     
+    @crew_component
     def legal_compliance_specialist(self) -> Agent:
         """Специалист по правовому соответствию."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['legal_compliance_specialist']
         )
-        legal_config = agents_config.get('legal_compliance_specialist', {})
         
         return Agent(
-            role=legal_config.get('role', 'Юридический специалист'),
-            goal=legal_config.get('goal', 'Правовое соответствие'),
-            backstory=legal_config.get('backstory', 'Юрист игровой индустрии'),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_legal_info,
-                web_search_tools.search_internet,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.search_legal_info,
+                self.search_tools.search_internet,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def technical_marketing_specialist(self) -> Agent:
         """Технический маркетинговый специалист."""
-        agents_config = self.config_manager.get_agents_config(
-            "agents_gaming.yaml"
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['technical_marketing_specialist']
         )
-        tech_config = agents_config.get('technical_marketing_specialist', {})
         
         return Agent(
-            role=tech_config.get('role', 'Технический маркетолог'),
-            goal=tech_config.get('goal', 'Технический маркетинг'),
-            backstory=tech_config.get('backstory', 'Технолог маркетинга'),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.research_product,
-                web_search_tools.search_marketing_strategies,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.research_product,
+                self.search_tools.search_marketing_strategies,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def gaming_market_research_task(self) -> Task:
         """Задача исследования игрового рынка."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_market_research_task']
         )
-        research_config = tasks_config.get('gaming_market_research_task', {})
         
         return Task(
-            description=research_config.get(
-                'description', 'Исследуйте игровой рынок'
-            ),
+            description=description,
             agent=self.gaming_market_analyst(),
-            expected_output=research_config.get(
-                'expected_output', 'Анализ игрового рынка'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_audience_analysis_task(self) -> Task:
         """Задача анализа игровой аудитории."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_audience_analysis_task']
         )
-        audience_config = tasks_config.get('gaming_audience_analysis_task', {})
         
         return Task(
-            description=audience_config.get(
-                'description', 'Проанализируйте аудиторию'
-            ),
+            description=description,
             agent=self.gaming_market_analyst(),
-            expected_output=audience_config.get(
-                'expected_output', 'Анализ аудитории'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_legal_risk_assessment_task(self) -> Task:
         """Задача оценки правовых рисков."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
-        )
-        legal_config = tasks_config.get(
-            'gaming_legal_risk_assessment_task', {}
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_legal_risk_assessment_task']
         )
         
         return Task(
-            description=legal_config.get(
-                'description', 'Оцените правовые риски'
-            ),
+            description=description,
             agent=self.legal_compliance_specialist(),
-            expected_output=legal_config.get(
-                'expected_output', 'Оценка рисков'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_community_strategy_task(self) -> Task:
         """Задача стратегии сообщества."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
-        )
-        community_config = tasks_config.get(
-            'gaming_community_strategy_task', {}
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_community_strategy_task']
         )
         
         return Task(
-            description=community_config.get(
-                'description', 'Разработайте стратегию сообщества'
-            ),
+            description=description,
             agent=self.community_manager(),
-            expected_output=community_config.get(
-                'expected_output', 'Стратегия сообщества'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_marketing_strategy_task(self) -> Task:
         """Задача игровой маркетинговой стратегии."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
-        )
-        strategy_config = tasks_config.get(
-            'gaming_marketing_strategy_task', {}
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_marketing_strategy_task']
         )
         
         return Task(
-            description=strategy_config.get(
-                'description', 'Разработайте игровую стратегию'
-            ),
+            description=description,
             agent=self.gaming_strategist(),
-            expected_output=strategy_config.get(
-                'expected_output', 'Игровая стратегия'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_content_creation_task(self) -> Task:
         """Задача создания игрового контента."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_content_creation_task']
         )
-        content_config = tasks_config.get('gaming_content_creation_task', {})
         
         return Task(
-            description=content_config.get(
-                'description', 'Создайте игровой контент'
-            ),
+            description=description,
             agent=self.content_creator_gaming(),
-            expected_output=content_config.get(
-                'expected_output', 'Игровой контент'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_technical_positioning_task(self) -> Task:
         """Задача технического позиционирования."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_technical_positioning_task']
         )
-        tech_config = tasks_config.get('gaming_technical_positioning_task', {})
         
         return Task(
-            description=tech_config.get(
-                'description', 'Позиционируйте технически'
-            ),
+            description=description,
             agent=self.technical_marketing_specialist(),
-            expected_output=tech_config.get(
-                'expected_output', 'Техническое позиционирование'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def gaming_campaign_execution_task(self) -> Task:
         """Задача выполнения игровой кампании."""
-        tasks_config = self.config_manager.get_tasks_config(
-            "tasks_gaming.yaml"
-        )
-        campaign_config = tasks_config.get(
-            'gaming_campaign_execution_task', {}
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['gaming_campaign_execution_task']
         )
         
         return Task(
-            description=campaign_config.get(
-                'description', 'Выполните игровую кампанию'
-            ),
+            description=description,
             agent=self.gaming_strategist(),
-            expected_output=campaign_config.get(
-                'expected_output', 'Исполнение кампании'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
@@ -2,11 +2,68 @@
 Стандартная реализация crew для обычного маркетинга.
 """
 
-from typing import List
+import logging
+from typing import Dict, List
 from crewai import Agent, Task
-from marketing_posts.core.base_crew import BaseCrew
+from marketing_posts.core.base_crew import (
+    AGENT_FIELDS,
+    TASK_FIELDS,
+    BaseCrew,
+    CrewConfig,
+    crew_component,
+    merge_defaults
+)
 from marketing_posts.core.config_manager import ConfigManager
-from marketing_posts.core.web_tools import web_search_tools, web_analysis_tools
+from marketing_posts.core.web_tools import (
+    get_web_analysis_tools,
+    get_web_search_tools
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Значения по умолчанию для полей, отсутствующих в YAML
+_AGENT_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'lead_market_analyst': {
+        'role': 'Ведущий аналитик рынка',
+        'goal': 'Проведение глубокого анализа рынка',
+        'backstory': 'Опытный аналитик с 10+ лет опыта'
+    },
+    'chief_marketing_strategist': {
+        'role': 'Главный маркетинговый стратег',
+        'goal': 'Разработка эффективных маркетинговых стратегий',
+        'backstory': 'Стратег с опытом в крупных компаниях'
+    },
+    'creative_content_creator': {
+        'role': 'Креативный создатель контента',
+        'goal': 'Создание привлекательного контента',
+        'backstory': 'Креативщик с богатым опытом'
+    }
+}
+
+_TASK_DEFAULTS: Dict[str, Dict[str, str]] = {
+    'research_task': {
+        'description': 'Проведите анализ рынка',
+        'expected_output': 'Детальный анализ рынка'
+    },
+    'project_understanding_task': {
+        'description': 'Изучите проект',
+        'expected_output': 'Понимание проекта'
+    },
+    'marketing_strategy_task': {
+        'description': 'Разработайте маркетинговую стратегию',
+        'expected_output': 'Маркетинговая стратегия'
+    },
+    'campaign_idea_task': {
+        'description': 'Создайте идеи кампаний',
+        'expected_output': 'Идеи кампаний'
+    },
+    'copy_creation_task': {
+        'description': 'Создайте копирайтинг',
+        'expected_output': 'Копирайтинг'
+    }
+}
 
 
 class StandardCrew(BaseCrew):
@@ -17,9 +74,19 @@ class StandardCrew(BaseCrew):
     маркетинговых стратегий общего назначения.
     """
     
-    def _validate_config(self) -> None:
+    __slots__ = (
+        'config_manager',
+        '_agents_cfg',
+        '_tasks_cfg',
+        'search_tools',
+        'analysis_tools'
+    )
+    
+    @classmethod
+    def validate_config(cls, config: CrewConfig) -> None:
         """Валидирует конфигурацию стандартного crew."""
-        if not self.config.agents_config or not self.config.tasks_config:
+        super().validate_config(config)
+        if not config.agents_config or not config.tasks_config:
             raise ValueError(
                 "Необходимо указать пути к конфигурациям агентов и задач"
             )
@@ -27,158 +94,152 @@ class StandardCrew(BaseCrew):
     def _initialize_crew(self) -> None:
         """Инициализирует компоненты стандартного crew."""
         self.config_manager = ConfigManager()
-        print("🏢 Используются стандартные агенты и задачи")
+        # Конфигурации читаются и дополняются значениями по умолчанию
+        # один раз на экземпляр crew
+        self._agents_cfg = merge_defaults(
+            self.config_manager.get_agents_config(),
+            _AGENT_DEFAULTS
+        )
+        self._tasks_cfg = merge_defaults(
+            self.config_manager.get_tasks_config(),
+            _TASK_DEFAULTS
+        )
+        self.search_tools = get_web_search_tools()
+        self.analysis_tools = get_web_analysis_tools()
+        logger.debug("Используются стандартные агенты и задачи")
     
+    @crew_component
     def lead_market_analyst(self) -> Agent:
         """Ведущий аналитик рынка."""
-        agents_config = self.config_manager.get_agents_config()
-        analyst_config = agents_config.get('lead_market_analyst', {})
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['lead_market_analyst']
+        )
         
         return Agent(
-            role=analyst_config.get('role', 'Ведущий аналитик рынка'),
-            goal=analyst_config.get(
-                'goal', 'Проведение глубокого анализа рынка'
-            ),
-            backstory=analyst_config.get(
-                'backstory', 'Опытный аналитик с 10+ лет опыта'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_internet,
-                web_search_tools.analyze_market,
-                web_search_tools.search_competitors,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.search_internet,
+                self.search_tools.analyze_market,
+                self.search_tools.search_competitors,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def chief_marketing_strategist(self) -> Agent:
         """Главный маркетинговый стратег."""
-        agents_config = self.config_manager.get_agents_config()
-        strategist_config = agents_config.get('chief_marketing_strategist', {})
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['chief_marketing_strategist']
+        )
         
         return Agent(
-            role=strategist_config.get(
-                'role', 'Главный маркетинговый стратег'
-            ),
-            goal=strategist_config.get(
-                'goal', 'Разработка эффективных маркетинговых стратегий'
-            ),
-            backstory=strategist_config.get(
-                'backstory', 'Стратег с опытом в крупных компаниях'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_marketing_strategies,
-                web_search_tools.search_trends,
-                web_search_tools.analyze_audience,
-                web_search_tools.research_product
+                self.search_tools.search_marketing_strategies,
+                self.search_tools.search_trends,
+                self.search_tools.analyze_audience,
+                self.search_tools.research_product
             ]
         )
     
+    @crew_component
     def creative_content_creator(self) -> Agent:
         """Креативный создатель контента."""
-        agents_config = self.config_manager.get_agents_config()
-        creator_config = agents_config.get('creative_content_creator', {})
+        role, goal, backstory = AGENT_FIELDS(
+            self._agents_cfg['creative_content_creator']
+        )
         
         return Agent(
-            role=creator_config.get(
-                'role', 'Креативный создатель контента'
-            ),
-            goal=creator_config.get(
-                'goal', 'Создание привлекательного контента'
-            ),
-            backstory=creator_config.get(
-                'backstory', 'Креативщик с богатым опытом'
-            ),
-            verbose=True,
+            role=role,
+            goal=goal,
+            backstory=backstory,
+            verbose=self.config.verbose,
             allow_delegation=False,
             llm=self.llm,
             tools=[
-                web_search_tools.search_trends,
-                web_search_tools.research_product,
-                web_analysis_tools.analyze_webpage
+                self.search_tools.search_trends,
+                self.search_tools.research_product,
+                self.analysis_tools.analyze_webpage
             ]
         )
     
+    @crew_component
     def research_task(self) -> Task:
         """Задача исследования рынка."""
-        tasks_config = self.config_manager.get_tasks_config()
-        research_config = tasks_config.get('research_task', {})
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['research_task']
+        )
         
         return Task(
-            description=research_config.get(
-                'description', 'Проведите анализ рынка'
-            ),
+            description=description,
             agent=self.lead_market_analyst(),
-            expected_output=research_config.get(
-                'expected_output', 'Детальный анализ рынка'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def project_understanding_task(self) -> Task:
         """Задача понимания проекта."""
-        tasks_config = self.config_manager.get_tasks_config()
-        understanding_config = tasks_config.get(
-            'project_understanding_task', {}
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['project_understanding_task']
         )
         
         return Task(
-            description=understanding_config.get(
-                'description', 'Изучите проект'
-            ),
+            description=description,
             agent=self.lead_market_analyst(),
-            expected_output=understanding_config.get(
-                'expected_output', 'Понимание проекта'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def marketing_strategy_task(self) -> Task:
         """Задача разработки маркетинговой стратегии."""
-        tasks_config = self.config_manager.get_tasks_config()
-        strategy_config = tasks_config.get('marketing_strategy_task', {})
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['marketing_strategy_task']
+        )
         
         return Task(
-            description=strategy_config.get(
-                'description', 'Разработайте маркетинговую стратегию'
-            ),
+            description=description,
             agent=self.chief_marketing_strategist(),
-            expected_output=strategy_config.get(
-                'expected_output', 'Маркетинговая стратегия'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def campaign_idea_task(self) -> Task:
         """Задача создания идей кампаний."""
-        tasks_config = self.config_manager.get_tasks_config()
-        campaign_config = tasks_config.get('campaign_idea_task', {})
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['campaign_idea_task']
+        )
         
         return Task(
-            description=campaign_config.get(
-                'description', 'Создайте идеи кампаний'
-            ),
+            description=description,
             agent=self.chief_marketing_strategist(),
-            expected_output=campaign_config.get(
-                'expected_output', 'Идеи кампаний'
-            ),
+            expected_output=expected_output,
             output_format='raw'
         )
     
+    @crew_component
     def copy_creation_task(self) -> Task:
         """Задача создания копирайтинга."""
-        tasks_config = self.config_manager.get_tasks_config()
-        copy_config = tasks_config.get('copy_creation_task', {})
+        description, expected_output = TASK_FIELDS(
+            self._tasks_cfg['copy_creation_task']
+        )
         
         return Task(
-            description=copy_config.get('description', 'Создайте копирайтинг'),
+            description=description,
             agent=self.creative_content_creator(),
-            expected_output=copy_config.get('expected_output', 'Копирайтинг'),
+            expected_output=expected_output,
             output_format='raw'
         )
     
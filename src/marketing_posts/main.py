@@ -4,14 +4,74 @@
 """
 
 import argparse
-from typing import Dict, Any, Optional
+import functools
+import json
+import logging
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional, Tuple
 
 from marketing_posts.core.base_crew import CrewConfig
 from marketing_posts.core.config_manager import ConfigManager
-from marketing_posts.core.result_saver import ResultSaver
+from marketing_posts.core.result_saver import ResultSaver, SaveResult
 from marketing_posts.core.crew_factory import CrewFactory, CrewBuilder
-from marketing_posts.crews.standard_crew import StandardCrew
-from marketing_posts.crews.gaming_crew import GamingCrew
+
+if TYPE_CHECKING:
+    # asyncio и пакетный runner импортируются лениво: --help и обычный
+    # синхронный запуск в них не нуждаются
+    from marketing_posts.core.batch_runner import ProcessorConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+_PROJECT_DESCRIPTION = (
+    "CrewAI, ведущий поставщик мультиагентных систем, стремится "
+    "совершить революцию в автоматизации маркетинга для своих "
+    "корпоративных клиентов. Проект включает разработку инновационной "
+    "маркетинговой стратегии, демонстрирующей передовые решения CrewAI "
+    "на базе ИИ, с акцентом на простоту использования, масштабируемость "
+    "и возможности интеграции. Кампания будет ориентирована на "
+    "технических руководителей (CTO) и IT-менеджеров крупных компаний "
+    "и покажет успешные кейсы внедрения и ощутимую выгоду от "
+    "использования CrewAI."
+)
+
+# Входные данные стандартного crew (только для чтения, одна копия)
+DEFAULT_INPUTS: Mapping[str, str] = MappingProxyType({
+    'customer_domain': 'crewai.com',
+    'project_description': _PROJECT_DESCRIPTION
+})
+
+# (use_gaming_config, crew_type) -> (фактический тип crew, метка отчета)
+CREW_DISPATCH: Dict[Tuple[bool, str], Tuple[str, str]] = {
+    (False, 'standard'): ('standard', 'Стандартная'),
+    (False, 'gaming'): ('gaming', 'Игровая'),
+    (True, 'standard'): ('gaming', 'Игровая'),
+    (True, 'gaming'): ('gaming', 'Игровая'),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _build_config(
+    crew_type: str,
+    llm_provider: str,
+    llm_model: Optional[str],
+    verbose: bool,
+    process: str = "sequential"
+) -> CrewConfig:
+    """Строит конфигурацию crew; CrewConfig неизменяем и общий."""
+    if crew_type == 'gaming':
+        builder = CrewBuilder.create_gaming_config()
+    else:
+        builder = CrewBuilder.create_standard_config()
+    return (builder
+            .with_llm_provider(llm_provider)
+            .with_llm_model(llm_model)
+            .with_verbose(verbose)
+            .with_process(process)
+            .build())
 
 
 class MarketingPostsRunner:
@@ -31,6 +91,11 @@ class MarketingPostsRunner:
     
     def _register_crew_types(self) -> None:
         """Регистрирует доступные типы crew в фабрике."""
+        # Импорт crew тянет crewai и langchain, поэтому выполняется
+        # только при создании runner, а не при разборе аргументов CLI
+        from marketing_posts.crews.standard_crew import StandardCrew
+        from marketing_posts.crews.gaming_crew import GamingCrew
+        
         self.crew_factory.register_crew_type('standard', StandardCrew)
         self.crew_factory.register_crew_type('gaming', GamingCrew)
     
@@ -44,7 +109,9 @@ class MarketingPostsRunner:
         try:
             return self.config_manager.get_gaming_config()
         except Exception as e:
-            print(f"⚠️ Ошибка загрузки игровой конфигурации: {e}")
+            logger.warning(
+                "⚠️ Ошибка загрузки игровой конфигурации: %s", e
+            )
             return {}
     
     def create_crew_config(
@@ -52,7 +119,8 @@ class MarketingPostsRunner:
         crew_type: str, 
         llm_provider: str = "deepseek",
         llm_model: Optional[str] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        process: str = "sequential"
     ) -> CrewConfig:
         """
         Создает конфигурацию crew.
@@ -62,22 +130,14 @@ class MarketingPostsRunner:
             llm_provider: Провайдер LLM
             llm_model: Модель LLM
             verbose: Режим подробного вывода
+            process: Процесс выполнения (sequential/hierarchical)
             
         Returns:
             Конфигурация crew
         """
-        if crew_type == 'gaming':
-            return (CrewBuilder.create_gaming_config()
-                    .with_llm_provider(llm_provider)
-                    .with_llm_model(llm_model)
-                    .with_verbose(verbose)
-                    .build())
-        else:
-            return (CrewBuilder.create_standard_config()
-                    .with_llm_provider(llm_provider)
-                    .with_llm_model(llm_model)
-                    .with_verbose(verbose)
-                    .build())
+        return _build_config(
+            crew_type, llm_provider, llm_model, verbose, process
+        )
     
     def run_crew(
         self, 
@@ -85,7 +145,8 @@ class MarketingPostsRunner:
         inputs: Dict[str, Any],
         llm_provider: str = "deepseek",
         llm_model: Optional[str] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        config: Optional[CrewConfig] = None
     ) -> Any:
         """
         Запускает crew с заданными параметрами.
@@ -96,18 +157,21 @@ class MarketingPostsRunner:
             llm_provider: Провайдер LLM
             llm_model: Модель LLM
             verbose: Режим подробного вывода
+            config: Готовая конфигурация; если задана, параметры LLM
+                и verbose не используются
             
         Returns:
             Результаты выполнения crew
         """
         try:
-            # Создаем конфигурацию
-            config = self.create_crew_config(
-                crew_type, llm_provider, llm_model, verbose
-            )
+            # Создаем конфигурацию, если вызывающий код ее не передал
+            if config is None:
+                config = self.create_crew_config(
+                    crew_type, llm_provider, llm_model, verbose
+                )
             
-            # Создаем crew через фабрику
-            crew = self.crew_factory.create_crew(crew_type, config)
+            # Получаем crew через фабрику (повторно используется)
+            crew = self.crew_factory.get_crew(crew_type, config)
             
             # Выполняем crew
             results = crew.execute(inputs)
@@ -115,9 +179,208 @@ class MarketingPostsRunner:
             return results
             
         except Exception as e:
-            print(f"❌ Ошибка выполнения crew: {e}")
+            logger.error("❌ Ошибка выполнения crew: %s", e)
+            raise
+    
+    async def run_crew_async(
+        self, 
+        crew_type: str, 
+        inputs: Dict[str, Any],
+        llm_provider: str = "deepseek",
+        llm_model: Optional[str] = None,
+        verbose: bool = True,
+        process: str = "sequential"
+    ) -> Any:
+        """
+        Асинхронно запускает crew с заданными параметрами.
+        
+        Args:
+            crew_type: Тип crew для запуска
+            inputs: Входные данные
+            llm_provider: Провайдер LLM
+            llm_model: Модель LLM
+            verbose: Режим подробного вывода
+            process: Процесс выполнения (sequential/hierarchical)
+            
+        Returns:
+            Результаты выполнения crew
+        """
+        try:
+            config = self.create_crew_config(
+                crew_type, llm_provider, llm_model, verbose, process
+            )
+            crew = self.crew_factory.create_crew(crew_type, config)
+            return await crew.execute_async(inputs)
+            
+        except Exception as e:
+            logger.error("❌ Ошибка выполнения crew: %s", e)
             raise
     
+    async def run_many_async(
+        self,
+        jobs: List[Tuple[str, Dict[str, Any]]],
+        llm_provider: str = "deepseek",
+        llm_model: Optional[str] = None,
+        verbose: bool = True
+    ) -> List[Any]:
+        """
+        Запускает несколько независимых crew одновременно.
+        
+        Время выполнения определяется самым долгим crew, а не суммой.
+        Ошибка одного crew не прерывает остальные.
+        
+        Args:
+            jobs: Пары (тип crew, входные данные)
+            llm_provider: Провайдер LLM
+            llm_model: Модель LLM
+            verbose: Режим подробного вывода
+            
+        Returns:
+            Результаты в порядке jobs; для упавших crew - исключение
+        """
+        import asyncio
+        
+        tasks = [
+            asyncio.create_task(self.run_crew_async(
+                crew_type, inputs, llm_provider, llm_model, verbose
+            ))
+            for crew_type, inputs in jobs
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def run_many(
+        self,
+        jobs: List[Tuple[str, Dict[str, Any]]],
+        llm_provider: str = "deepseek",
+        llm_model: Optional[str] = None,
+        verbose: bool = True
+    ) -> List[Any]:
+        """Синхронная обертка над run_many_async."""
+        import asyncio
+        
+        return asyncio.run(self.run_many_async(
+            jobs, llm_provider, llm_model, verbose
+        ))
+    
+    def run_batch(
+        self,
+        batch_file: str,
+        crew_type: str = "standard",
+        llm_provider: str = "deepseek",
+        llm_model: Optional[str] = None,
+        verbose: bool = True,
+        processor_config: Optional['ProcessorConfig'] = None,
+        process: str = "sequential",
+        dry_run: bool = False
+    ) -> List[Any]:
+        """
+        Выполняет пакет заданий из JSONL файла.
+        
+        Каждая строка файла - объект с необязательными полями crew_type
+        и inputs (по умолчанию DEFAULT_INPUTS). Задания выполняются
+        параллельно с ограничением числа одновременных запусков и частоты
+        запросов, временные ошибки повторяются.
+        
+        Args:
+            batch_file: Путь к JSONL файлу с заданиями
+            crew_type: Тип crew по умолчанию
+            llm_provider: Провайдер LLM
+            llm_model: Модель LLM
+            verbose: Режим подробного вывода
+            processor_config: Параметры пакетного выполнения
+            process: Процесс выполнения (sequential/hierarchical)
+            dry_run: Не сохранять результаты
+            
+        Returns:
+            Результаты в порядке заданий; для упавших - исключение
+        """
+        import asyncio
+        from marketing_posts.core.batch_runner import BatchRunner
+        
+        with open(batch_file, encoding='utf-8') as f:
+            items = [json.loads(line) for line in f if line.strip()]
+        
+        async def run_item(item: Dict[str, Any]) -> Any:
+            return await self.run_crew_async(
+                item.get('crew_type', crew_type),
+                item.get('inputs') or dict(DEFAULT_INPUTS),
+                llm_provider,
+                llm_model,
+                verbose,
+                process
+            )
+        
+        async def run_all() -> List[Any]:
+            results = await BatchRunner(run_item, processor_config).run(
+                items
+            )
+            
+            saves = []
+            batch_dir: Optional[Path] = None
+            for index, (item, result) in enumerate(zip(items, results), 1):
+                item_crew_type = item.get('crew_type', crew_type)
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "❌ Задание %d (%s): %s",
+                        index, item_crew_type, result
+                    )
+                    continue
+                if dry_run:
+                    continue
+                
+                # У каждого задания своя поддиректория: имена файлов
+                # с точностью до секунды иначе бы совпали
+                if batch_dir is None:
+                    batch_dir = Path(
+                        self.result_saver.create_results_directory()
+                    )
+                item_dir = batch_dir / f"item_{index:03d}"
+                item_dir.mkdir(exist_ok=True)
+                
+                config = self.create_crew_config(
+                    item_crew_type, llm_provider, llm_model, verbose, process
+                )
+                config_info = {
+                    'crew_type': item_crew_type,
+                    'llm_provider': config.llm_provider,
+                    'llm_model': config.llm_model,
+                    'agents_config': config.agents_config,
+                    'tasks_config': config.tasks_config,
+                    'process': config.process,
+                    'batch_item': index
+                }
+                saves.append(self.save_results_async(
+                    result, item_crew_type, config_info, str(item_dir)
+                ))
+            
+            # Сохранения независимых заданий выполняются параллельно
+            await asyncio.gather(*saves)
+            return results
+        
+        logger.info("📦 Пакетный запуск: %d заданий", len(items))
+        return asyncio.run(run_all())
+    
+    def _report_saved(self, saved: Dict[str, SaveResult]) -> None:
+        """Выводит статус сохранения результатов и конфигурации."""
+        save_result = saved['results']
+        
+        if save_result.success:
+            logger.info("✅ Результаты сохранены: %s", save_result.file_path)
+            
+            config_save = saved['config']
+            if config_save.success:
+                logger.info("✅ Информация о конфигурации сохранена")
+            else:
+                logger.warning(
+                    "⚠️ Ошибка сохранения конфигурации: %s",
+                    config_save.error_message
+                )
+        else:
+            logger.error(
+                "❌ Ошибка сохранения результатов: %s",
+                save_result.error_message
+            )
+    
     def save_results(
         self, 
         results: Any, 
@@ -133,33 +396,37 @@ class MarketingPostsRunner:
             config_info: Информация о конфигурации
         """
         try:
-            # Создаем директорию результатов
-            results_dir = self.result_saver.create_results_directory()
-            
-            # Сохраняем результаты
-            save_result = self.result_saver.save_marketing_results(
-                results, results_dir
-            )
-            
-            if save_result.success:
-                print(f"✅ Результаты сохранены: {save_result.file_path}")
-                
-                # Сохраняем информацию о конфигурации
-                config_save = self.result_saver.save_config_info(
-                    config_info, results_dir
-                )
+            # Результаты и конфигурация записываются параллельно
+            saved = self.result_saver.save_all(results, config_info)
+            self._report_saved(saved)
                 
-                if config_save.success:
-                    print("✅ Информация о конфигурации сохранена")
-                else:
-                    error_msg = config_save.error_message
-                    print(f"⚠️ Ошибка сохранения конфигурации: {error_msg}")
-            else:
-                error_msg = save_result.error_message
-                print(f"❌ Ошибка сохранения результатов: {error_msg}")
+        except Exception as e:
+            logger.error("❌ Ошибка сохранения: %s", e)
+    
+    async def save_results_async(
+        self, 
+        results: Any, 
+        crew_type: str,
+        config_info: Dict[str, Any],
+        results_dir: Optional[str] = None
+    ) -> None:
+        """
+        Асинхронно сохраняет результаты выполнения.
+        
+        Args:
+            results: Результаты выполнения
+            crew_type: Тип crew
+            config_info: Информация о конфигурации
+            results_dir: Директория для сохранения (по умолчанию новая)
+        """
+        try:
+            saved = await self.result_saver.save_all_async(
+                results, config_info, results_dir
+            )
+            self._report_saved(saved)
                 
         except Exception as e:
-            print(f"❌ Ошибка сохранения: {e}")
+            logger.error("❌ Ошибка сохранения: %s", e)
     
     def run(
         self, 
@@ -167,7 +434,9 @@ class MarketingPostsRunner:
         use_gaming_config: bool = False,
         llm_provider: str = "deepseek",
         llm_model: Optional[str] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        process: str = "sequential",
+        dry_run: bool = False
     ) -> None:
         """
         Основной метод запуска системы.
@@ -178,68 +447,85 @@ class MarketingPostsRunner:
             llm_provider: Провайдер LLM
             llm_model: Модель LLM
             verbose: Режим подробного вывода
+            process: Процесс выполнения (sequential/hierarchical)
+            dry_run: Не сохранять результаты и отчеты об ошибках
         """
+        # Определяем тип crew и метку для отчета об ошибке одним поиском;
+        # для типов вне таблицы игровая конфигурация по-прежнему
+        # запускает игровой crew, иначе тип запускается как есть
+        actual_crew_type, config_type = CREW_DISPATCH.get(
+            (use_gaming_config, crew_type),
+            ('gaming', 'Игровая') if use_gaming_config
+            else (crew_type, 'Стандартная')
+        )
+        
         try:
-            print("🚀 Запуск системы маркетинговых постов")
-            print(f"📋 Тип crew: {crew_type}")
-            print(f"🤖 Провайдер LLM: {llm_provider}")
-            
-            # Определяем тип crew
-            actual_crew_type = 'gaming' if use_gaming_config else crew_type
+            logger.info("🚀 Запуск системы маркетинговых постов")
+            logger.info("📋 Тип crew: %s", crew_type)
+            logger.info("🤖 Провайдер LLM: %s", llm_provider)
             
             # Подготавливаем входные данные
-            inputs = {}
+            inputs: Dict[str, Any] = dict(DEFAULT_INPUTS)
             if use_gaming_config:
                 gaming_config = self.load_gaming_config()
                 if gaming_config:
                     inputs = gaming_config.get('project_info', {})
-                    print("🎮 Загружена игровая конфигурация")
+                    logger.info("🎮 Загружена игровая конфигурация")
                 else:
-                    print("⚠️ Игровая конфигурация не загружена, "
-                          "используются стандартные данные")
+                    logger.warning("⚠️ Игровая конфигурация не загружена, "
+                                   "используются стандартные данные")
             
-            # Запускаем crew
-            results = self.run_crew(
-                actual_crew_type, inputs, llm_provider, llm_model, verbose
+            # Конфигурация строится один раз и используется и для
+            # запуска, и для config_info
+            config = self.create_crew_config(
+                actual_crew_type, llm_provider, llm_model, verbose, process
             )
             
-            # Получаем информацию о конфигурации
-            config = self.create_crew_config(
-                actual_crew_type, llm_provider, llm_model, verbose
+            # Запускаем crew
+            results = self.run_crew(
+                actual_crew_type, inputs, config=config
             )
-            config_info = {
-                'crew_type': actual_crew_type,
-                'llm_provider': config.llm_provider,
-                'llm_model': config.llm_model,
-                'agents_config': config.agents_config,
-                'tasks_config': config.tasks_config,
-                'use_gaming_config': use_gaming_config
-            }
             
-            # Сохраняем результаты
-            self.save_results(results, actual_crew_type, config_info)
+            # Сохраняем результаты; в режиме dry-run на диск ничего
+            # не пишется и директория результатов не создается
+            if dry_run:
+                logger.info("🧪 Dry-run: результаты не сохраняются")
+            else:
+                config_info = {
+                    'crew_type': actual_crew_type,
+                    'llm_provider': config.llm_provider,
+                    'llm_model': config.llm_model,
+                    'agents_config': config.agents_config,
+                    'tasks_config': config.tasks_config,
+                    'process': config.process,
+                    'use_gaming_config': use_gaming_config
+                }
+                self.save_results(results, actual_crew_type, config_info)
             
-            print("✅ Выполнение завершено успешно")
+            logger.info("✅ Выполнение завершено успешно")
             
         except Exception as e:
-            print(f"❌ Критическая ошибка: {e}")
+            logger.exception("❌ Критическая ошибка: %s", e)
+            if dry_run:
+                return
             
             # Сохраняем отчет об ошибке
             try:
-                config_type = 'Игровая' if use_gaming_config else 'Стандартная'
                 error_save = self.result_saver.save_error_report(
                     str(e), 
                     config_type=config_type
                 )
                 if error_save.success:
-                    print(f"📄 Отчет об ошибке сохранен: "
-                          f"{error_save.file_path}")
+                    logger.info(
+                        "📄 Отчет об ошибке сохранен: %s",
+                        error_save.file_path
+                    )
             except Exception as save_error:
-                print(f"❌ Ошибка сохранения отчета: {save_error}")
+                logger.error("❌ Ошибка сохранения отчета: %s", save_error)
 
 
-def main():
-    """Точка входа в приложение."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Создает парсер аргументов командной строки."""
     parser = argparse.ArgumentParser(
         description="Система маркетинговых постов CrewAI"
     )
@@ -270,21 +556,79 @@ def main():
     
     parser.add_argument(
         '--verbose',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Подробный вывод агентов и crew'
+    )
+    
+    parser.add_argument(
+        '--process',
+        choices=['sequential', 'hierarchical'],
+        default='sequential',
+        help='Процесс выполнения задач (default: sequential); '
+             'hierarchical распределяет задачи через агента-менеджера'
+    )
+    
+    parser.add_argument(
+        '--dry-run',
         action='store_true',
-        default=True,
-        help='Подробный вывод (default: True)'
+        help='Не сохранять результаты на диск (для быстрых проверок)'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='JSONL файл с заданиями для пакетного запуска'
+    )
+    
+    return parser
+
+
+# Парсер создается при первом вызове main() и переиспользуется
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Точка входа в приложение.
+    
+    Args:
+        argv: Аргументы командной строки (по умолчанию sys.argv[1:])
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args(argv)
+    
+    # Статусные сообщения выводятся в stdout без служебных префиксов
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
     
     # Создаем и запускаем runner
     runner = MarketingPostsRunner()
+    if args.batch:
+        runner.run_batch(
+            args.batch,
+            crew_type=args.crew_type,
+            llm_provider=args.llm_provider,
+            llm_model=args.llm_model,
+            verbose=args.verbose,
+            process=args.process,
+            dry_run=args.dry_run
+        )
+        return
+    
     runner.run(
         crew_type=args.crew_type,
         use_gaming_config=args.use_gaming_config,
         llm_provider=args.llm_provider,
         llm_model=args.llm_model,
-        verbose=args.verbose
+        verbose=args.verbose,
+        process=args.process,
+        dry_run=args.dry_run
     )
 
 
@@ -26,11 +26,15 @@ def test_deepseek_llm():
     print()
     
     # Показать доступные модели
-    print("2. Доступные модели DeepSeek:")
+    # Список собирается целиком и выводится одним вызовом print
+    lines = ["2. Доступные модели DeepSeek:"]
     for provider, models in AVAILABLE_MODELS.items():
-        print(f"   {provider.upper()}:")
-        for model_id, model_name in models.items():
-            print(f"     - {model_id}: {model_name}")
+        lines.append(f"   {provider.upper()}:")
+        lines.extend(
+            f"     - {model_id}: {model_name}"
+            for model_id, model_name in models.items()
+        )
+    print("\n".join(lines))
     
     return True
 
@@ -0,0 +1,232 @@
+"""
+Тесты пакетного запуска: повторы, задержки и ограничение частоты.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from marketing_posts.core import batch_runner
+from marketing_posts.core.batch_runner import (
+    BatchRunner,
+    ProcessorConfig,
+    RateLimiter,
+    TransientError
+)
+
+
+pytestmark = pytest.mark.unit
+
+# Минимальные задержки, чтобы повторы не замедляли тесты
+FAST = ProcessorConfig(rpm=0, base_delay=0.001, max_delay=0.01)
+
+
+class FlakyItem:
+    """Задание, которое падает заданное число раз, затем выполняется."""
+
+    def __init__(self, failures: int, error: Exception):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, item: Dict[str, Any]) -> Any:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return item['value']
+
+
+def run(runner: BatchRunner, items: List[Dict[str, Any]]) -> List[Any]:
+    """Выполняет пакет в новом цикле событий."""
+    return asyncio.run(runner.run(items))
+
+
+class TestRetries:
+    """Повторы при ошибках."""
+
+    def test_transient_error_is_retried(self) -> None:
+        run_item = FlakyItem(failures=2, error=TransientError("503"))
+
+        results = run(BatchRunner(run_item, FAST), [{'value': 42}])
+
+        assert results == [42]
+        assert run_item.calls == 3
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        error = TransientError("503")
+        run_item = FlakyItem(failures=10, error=error)
+
+        results = run(BatchRunner(run_item, FAST), [{'value': 42}])
+
+        assert results == [error]
+        assert run_item.calls == FAST.max_attempts
+
+    @pytest.mark.parametrize('error', [
+        ValueError("bad config"),
+        TypeError("bad type"),
+        KeyError("missing")
+    ])
+    def test_configuration_error_is_not_retried(
+        self,
+        error: Exception
+    ) -> None:
+        run_item = FlakyItem(failures=1, error=error)
+
+        results = run(BatchRunner(run_item, FAST), [{'value': 42}])
+
+        assert results == [error]
+        assert run_item.calls == 1
+
+    def test_auth_failure_is_not_retried(self) -> None:
+        # Так DeepSeekLLM сообщал о 401 до появления типизированных ошибок
+        error = Exception("Ошибка запроса к DeepSeek API: 401 Unauthorized")
+        run_item = FlakyItem(failures=1, error=error)
+
+        results = run(BatchRunner(run_item, FAST), [{'value': 42}])
+
+        assert results == [error]
+        assert run_item.calls == 1
+
+    def test_retry_on_is_configurable(self) -> None:
+        run_item = FlakyItem(failures=1, error=ConnectionError())
+        config = ProcessorConfig(
+            rpm=0, base_delay=0.001, retry_on=(ConnectionError,)
+        )
+
+        results = run(BatchRunner(run_item, config), [{'value': 42}])
+
+        assert results == [42]
+        assert run_item.calls == 2
+
+    def test_timeout_is_not_retried_even_if_listed(self) -> None:
+        calls = 0
+
+        async def slow(item: Dict[str, Any]) -> Any:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(1)
+
+        config = ProcessorConfig(
+            rpm=0,
+            timeout_per_item=0.01,
+            base_delay=0.001,
+            retry_on=(Exception,)
+        )
+        results = run(BatchRunner(slow, config), [{}])
+
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert calls == 1
+
+    def test_timeout_is_not_retried(self) -> None:
+        calls = 0
+
+        async def slow(item: Dict[str, Any]) -> Any:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(1)
+
+        config = ProcessorConfig(
+            rpm=0, timeout_per_item=0.01, base_delay=0.001
+        )
+        results = run(BatchRunner(slow, config), [{}])
+
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert calls == 1
+
+    def test_no_timeout_by_default(self) -> None:
+        assert ProcessorConfig().timeout_per_item is None
+
+    def test_failure_does_not_stop_other_items(self) -> None:
+        async def run_item(item: Dict[str, Any]) -> Any:
+            if item['value'] is None:
+                raise ValueError("no value")
+            return item['value']
+
+        results = run(
+            BatchRunner(run_item, FAST),
+            [{'value': 1}, {'value': None}, {'value': 3}]
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 3
+
+
+class TestBackoff:
+    """Экспоненциальная задержка между повторами."""
+
+    def test_delay_doubles_and_is_capped(
+        self,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(batch_runner.random, 'uniform', lambda a, b: 0)
+        runner = BatchRunner(
+            FlakyItem(0, RuntimeError()),
+            ProcessorConfig(base_delay=1.0, max_delay=5.0)
+        )
+
+        delays = [runner._backoff(attempt) for attempt in range(1, 6)]
+
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_jitter_stays_within_base_delay(self) -> None:
+        runner = BatchRunner(
+            FlakyItem(0, RuntimeError()),
+            ProcessorConfig(base_delay=1.0, max_delay=30.0)
+        )
+
+        for _ in range(100):
+            assert 2.0 <= runner._backoff(2) <= 3.0
+
+
+class TestConcurrency:
+    """Ограничение параллелизма и частоты запусков."""
+
+    def test_max_workers_limits_items_in_flight(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def run_item(item: Dict[str, Any]) -> Any:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item['value']
+
+        config = ProcessorConfig(max_workers=2, rpm=0)
+        items = [{'value': i} for i in range(6)]
+        results = run(BatchRunner(run_item, config), items)
+
+        assert results == list(range(6))
+        assert peak == 2
+
+    def test_rate_limiter_spaces_starts(self) -> None:
+        async def acquire_all(limiter: RateLimiter) -> List[float]:
+            loop = asyncio.get_running_loop()
+
+            async def acquire() -> float:
+                await limiter.acquire()
+                return loop.time()
+
+            start = loop.time()
+            times = await asyncio.gather(*(acquire() for _ in range(4)))
+            return sorted(time - start for time in times)
+
+        # 1200 запусков в минуту - интервал 50 мс
+        times = asyncio.run(acquire_all(RateLimiter(1200)))
+
+        assert times[0] < 0.05
+        for earlier, later in zip(times, times[1:]):
+            assert later - earlier >= 0.045
+
+    def test_rate_limiter_disabled_for_zero_rpm(self) -> None:
+        async def acquire_all(limiter: RateLimiter) -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(100):
+                await limiter.acquire()
+            return loop.time() - start
+
+        assert asyncio.run(acquire_all(RateLimiter(0))) < 0.05
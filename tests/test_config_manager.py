@@ -0,0 +1,127 @@
+"""
+Тесты загрузки конфигураций: скомпилированные YAML и кэш.
+"""
+
+import hashlib
+import runpy
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+import yaml
+
+from marketing_posts.config._compiled import COMPILED_CONFIGS
+from marketing_posts.core import config_manager
+from marketing_posts.core.config_manager import (
+    ConfigManager,
+    ConfigValidationError
+)
+
+
+pytestmark = pytest.mark.unit
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CONFIG_DIR = ROOT_DIR / "src" / "marketing_posts" / "config"
+COMPILER = runpy.run_path(str(ROOT_DIR / "tools" / "compile_configs.py"))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Изолирует тесты от общего кэша конфигураций."""
+    config_manager._load_and_validate.cache_clear()
+    yield
+    config_manager._load_and_validate.cache_clear()
+
+
+def fail_parse(data: bytes) -> Any:
+    """Подменяет разбор YAML, чтобы отследить обращения к нему."""
+    raise AssertionError("YAML не должен разбираться")
+
+
+class TestCompiledConfigs:
+    """Скомпилированный модуль соответствует YAML файлам."""
+
+    def test_compiled_module_is_up_to_date(self) -> None:
+        compiled = (CONFIG_DIR / "_compiled.py").read_text(encoding='utf-8')
+
+        assert COMPILER['compile_configs']() == compiled
+
+    @pytest.mark.parametrize('file_name', list(COMPILER['CONFIG_FILES']))
+    def test_compiled_config_matches_yaml(self, file_name: str) -> None:
+        data = (CONFIG_DIR / file_name).read_bytes()
+
+        compiled = COMPILED_CONFIGS[hashlib.sha256(data).hexdigest()]
+
+        assert compiled == yaml.safe_load(data)
+
+    @pytest.mark.parametrize('file_name', list(COMPILER['CONFIG_FILES']))
+    def test_unchanged_file_skips_yaml(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        file_name: str
+    ) -> None:
+        monkeypatch.setattr(config_manager, '_parse_yaml', fail_parse)
+
+        config = ConfigManager(str(CONFIG_DIR)).load_config(
+            'other', file_name
+        )
+
+        data = (CONFIG_DIR / file_name).read_bytes()
+        assert config == COMPILED_CONFIGS[hashlib.sha256(data).hexdigest()]
+
+    def test_modified_file_is_parsed(self, tmp_path: Path) -> None:
+        data = (CONFIG_DIR / "agents.yaml").read_bytes()
+        (tmp_path / "agents.yaml").write_bytes(data + b"\n# changed\n")
+
+        config = ConfigManager(str(tmp_path)).get_agents_config()
+
+        assert config == COMPILED_CONFIGS[hashlib.sha256(data).hexdigest()]
+
+    def test_invalid_yaml_is_reported(self, tmp_path: Path) -> None:
+        (tmp_path / "agents.yaml").write_text("a: [1, 2", encoding='utf-8')
+
+        with pytest.raises(ConfigValidationError) as excinfo:
+            ConfigManager(str(tmp_path)).get_agents_config()
+
+        assert "Неверный YAML" in excinfo.value.message
+
+
+class TestConfigManager:
+    """Кэширование и копирование загруженных конфигураций."""
+
+    def test_keys_are_interned(self) -> None:
+        config = ConfigManager(str(CONFIG_DIR)).get_agents_config()
+
+        for name, agent in config.items():
+            assert name is sys.intern(name)
+            for field in agent:
+                assert field is sys.intern(field)
+
+    def test_returned_config_is_a_copy(self) -> None:
+        manager = ConfigManager(str(CONFIG_DIR))
+        config: Dict[str, Any] = manager.get_tasks_config()
+        config.clear()
+
+        assert manager.get_tasks_config()
+
+    def test_cache_info(self) -> None:
+        manager = ConfigManager(str(CONFIG_DIR))
+        manager.get_agents_config()
+        manager.get_agents_config()
+        manager.get_tasks_config()
+
+        info = manager.get_cache_info()
+
+        assert info['cached_configs'] == [
+            'agents_agents.yaml', 'tasks_tasks.yaml'
+        ]
+        assert info['cache_size'] == 2
+        assert (info['hits'], info['misses']) == (1, 2)
+
+        manager.clear_cache()
+        assert manager.get_cache_info()['cache_size'] == 0
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ConfigManager(str(tmp_path)).get_agents_config()
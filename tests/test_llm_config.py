@@ -0,0 +1,248 @@
+"""
+Тесты DeepSeekLLM: кэш ответов и классификация ошибок API.
+"""
+
+from typing import Any, Dict, Optional
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("langchain_core")
+
+from urllib3.exceptions import ProtocolError  # noqa: E402
+
+from marketing_posts.config import llm_config  # noqa: E402
+from marketing_posts.config.llm_config import (  # noqa: E402
+    DeepSeekAPIError,
+    DeepSeekLLM,
+    DeepSeekTransientError,
+    _ResponseCache
+)
+from marketing_posts.core.batch_runner import TransientError  # noqa: E402
+
+
+pytestmark = pytest.mark.unit
+
+
+def make_response(status_code: int, body: bytes = b"") -> Any:
+    """Создает ответ requests с заданным статусом и телом."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = "https://api.deepseek.com/v1/chat/completions"
+    return response
+
+
+class FakeSession:
+    """Сессия, которая отвечает заданным ответом или исключением."""
+
+    def __init__(
+        self,
+        response: Optional[Any] = None,
+        error: Optional[Exception] = None
+    ):
+        self.response = response
+        self.error = error
+        self.calls = 0
+
+    def post(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+@pytest.fixture
+def llm() -> DeepSeekLLM:
+    """Недетерминированная модель: кэш ответов не используется."""
+    return DeepSeekLLM(api_key="test", model="deepseek-chat", temperature=1)
+
+
+def call_with(
+    monkeypatch: pytest.MonkeyPatch,
+    llm: DeepSeekLLM,
+    session: FakeSession
+) -> str:
+    """Вызывает модель через подставную HTTP-сессию."""
+    monkeypatch.setattr(llm_config, "_get_session", lambda: session)
+    return llm._call("привет")
+
+
+class FakeClock:
+    """Управляемые часы для проверки времени жизни записей."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """LRU-кэш ответов с ограничением времени жизни."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+        clock = FakeClock()
+        monkeypatch.setattr(llm_config.time, 'monotonic', clock)
+        return clock
+
+    def test_returns_stored_value(self, clock: FakeClock) -> None:
+        cache = _ResponseCache()
+        cache.set("k", "v")
+
+        assert cache.get("k") == "v"
+        assert cache.get("other") is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    def test_entry_expires_after_ttl(self, clock: FakeClock) -> None:
+        cache = _ResponseCache(ttl=10.0)
+        cache.set("k", "v")
+
+        clock.now += 10.0
+        assert cache.get("k") == "v"
+
+        clock.now += 0.1
+        assert cache.get("k") is None
+        assert cache.stats()['size'] == 0
+
+    def test_least_recently_used_is_evicted(self, clock: FakeClock) -> None:
+        cache = _ResponseCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        # Обращение делает "a" самой свежей записью
+        assert cache.get("a") == "1"
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_overwrite_refreshes_entry(self, clock: FakeClock) -> None:
+        cache = _ResponseCache(maxsize=2, ttl=10.0)
+        cache.set("a", "old")
+        clock.now += 8.0
+        cache.set("b", "2")
+        cache.set("a", "new")
+        clock.now += 8.0
+
+        cache.set("c", "3")
+
+        assert cache.get("a") == "new"
+        assert cache.get("b") is None
+
+    def test_clear_resets_entries_and_stats(self, clock: FakeClock) -> None:
+        cache = _ResponseCache()
+        cache.set("k", "v")
+        cache.get("k")
+
+        cache.clear()
+
+        assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0}
+
+    @pytest.mark.parametrize('changed', [
+        {'model': "deepseek-reasoner"},
+        {'prompt': "другой"},
+        {'temperature': 0.5},
+        {'stop': ["\n"]},
+        {'max_tokens': 10}
+    ])
+    def test_key_depends_on_every_parameter(
+        self,
+        changed: Dict[str, Any]
+    ) -> None:
+        params: Dict[str, Any] = {
+            'model': "deepseek-chat",
+            'prompt': "привет",
+            'temperature': 0.0,
+            'stop': None,
+            'max_tokens': 1000
+        }
+
+        key = _ResponseCache.make_key(**params)
+
+        assert _ResponseCache.make_key(**{**params, **changed}) != key
+
+
+class TestErrorClassification:
+    """Тип исключения определяет, повторит ли задание BatchRunner."""
+
+    @pytest.mark.parametrize('status_code', [400, 401, 403, 500, 502])
+    def test_http_error_is_not_transient(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM,
+        status_code: int
+    ) -> None:
+        session = FakeSession(response=make_response(status_code))
+
+        with pytest.raises(DeepSeekAPIError) as excinfo:
+            call_with(monkeypatch, llm, session)
+
+        assert not isinstance(excinfo.value, TransientError)
+
+    @pytest.mark.parametrize('status_code', [429, 503])
+    def test_overload_status_is_transient(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM,
+        status_code: int
+    ) -> None:
+        session = FakeSession(response=make_response(status_code))
+
+        with pytest.raises(DeepSeekTransientError):
+            call_with(monkeypatch, llm, session)
+
+    @pytest.mark.parametrize('error', [
+        requests.exceptions.RetryError("too many 429"),
+        requests.exceptions.ConnectTimeout("connect timeout"),
+        requests.exceptions.ConnectionError("name resolution failed")
+    ])
+    def test_request_not_sent_is_transient(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM,
+        error: Exception
+    ) -> None:
+        with pytest.raises(TransientError):
+            call_with(monkeypatch, llm, FakeSession(error=error))
+
+    @pytest.mark.parametrize('error', [
+        requests.exceptions.ReadTimeout("read timeout"),
+        requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.")
+        )
+    ])
+    def test_request_possibly_processed_is_not_transient(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM,
+        error: Exception
+    ) -> None:
+        with pytest.raises(DeepSeekAPIError) as excinfo:
+            call_with(monkeypatch, llm, FakeSession(error=error))
+
+        assert not isinstance(excinfo.value, TransientError)
+
+    def test_malformed_response_is_not_transient(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM
+    ) -> None:
+        session = FakeSession(response=make_response(200, b'{"x": 1}'))
+
+        with pytest.raises(DeepSeekAPIError) as excinfo:
+            call_with(monkeypatch, llm, session)
+
+        assert not isinstance(excinfo.value, TransientError)
+
+    def test_success_returns_content(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        llm: DeepSeekLLM
+    ) -> None:
+        body = b'{"choices": [{"message": {"content": "ok"}}]}'
+        session = FakeSession(response=make_response(200, body))
+
+        assert call_with(monkeypatch, llm, session) == "ok"
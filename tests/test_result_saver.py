@@ -0,0 +1,185 @@
+"""
+Тесты сохранения результатов: очистка текста и запись файлов.
+"""
+
+import os
+import random
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from marketing_posts.core import result_saver
+from marketing_posts.core.result_saver import ResultFormatter, _write_file
+
+
+pytestmark = pytest.mark.unit
+
+
+def reference_clean_text(text: object) -> str:
+    """Исходная реализация clean_text, с которой сверяется текущая."""
+    if not isinstance(text, str):
+        return str(text)
+
+    text = text.replace('\\n', '\n')
+    text = text.replace('\\"', '"')
+    text = text.replace("\\'", "'")
+
+    if text.startswith("('raw', '") and text.endswith("')"):
+        start_idx = text.find("('raw', '") + 9
+        end_idx = text.rfind("')")
+        if start_idx > 8 and end_idx > start_idx:
+            text = text[start_idx:end_idx]
+            try:
+                text = text.encode('latin-1').decode('unicode_escape')
+            except (UnicodeDecodeError, UnicodeEncodeError):
+                pass
+
+    return text
+
+
+# Фрагменты, из которых собираются случайные входы: экранирование,
+# границы кортежа ('raw', '...') и не-latin-1 символы
+_PIECES = [
+    'a', 'текст', ' ', '\n', '\\', '\\n', '\\"', "\\'", '\\\\', '\\t',
+    '\\x41', '\\u0416', '\\N', '"', "'", '(', ')', "')", "('raw', '",
+    '\\\\n', 'é', '🎮'
+]
+
+
+def random_texts(count: int, seed: int = 20240601) -> Iterator[str]:
+    """Генерирует воспроизводимые случайные входы для clean_text."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        body = "".join(
+            rng.choice(_PIECES) for _ in range(rng.randint(0, 12))
+        )
+        wrap = rng.random()
+        if wrap < 0.4:
+            yield f"('raw', '{body}')"
+        elif wrap < 0.5:
+            yield f"('raw', '{body}"
+        else:
+            yield body
+
+
+# unicode_escape предупреждает о неизвестных последовательностях вроде \(
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+class TestCleanText:
+    """clean_text совпадает с исходной реализацией."""
+
+    @pytest.mark.parametrize('text', [
+        "",
+        "обычный текст",
+        "строка\\nперенос",
+        "('raw', '')",
+        "('raw', 'x')",
+        "('raw', 'Привет\\nмир')",
+        "('raw', '\\u0416\\x41')",
+        "('raw', 'битый \\x4')",
+        "('raw', 'без конца",
+        "\\\\n"
+    ])
+    def test_known_inputs(self, text: str) -> None:
+        assert ResultFormatter.clean_text(text) == reference_clean_text(text)
+
+    def test_random_inputs(self) -> None:
+        for text in random_texts(20000):
+            expected = reference_clean_text(text)
+            assert ResultFormatter.clean_text(text) == expected, text
+
+    def test_non_string_is_converted(self) -> None:
+        assert ResultFormatter.clean_text(42) == "42"  # type: ignore[arg-type]
+
+
+class TestWriteFile:
+    """Запись фрагментов через writev() пачками."""
+
+    def test_writes_all_chunks(self, tmp_path: Path) -> None:
+        chunks = [b"abc", b"", "данные".encode('utf-8'), b"\n" * 10]
+        path = tmp_path / "out.md"
+
+        _write_file(path, iter(chunks))
+
+        assert path.read_bytes() == b"".join(chunks)
+
+    def test_overwrites_existing_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "out.md"
+        path.write_bytes(b"x" * 100)
+
+        _write_file(path, [b"short"])
+
+        assert path.read_bytes() == b"short"
+
+    def test_partial_writev_is_resumed(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def partial_writev(fd: int, buffers: List[memoryview]) -> int:
+            # Ядро может записать меньше, чем передано
+            return os.write(fd, bytes(buffers[0][:3]))
+
+        monkeypatch.setattr(result_saver.os, 'writev', partial_writev)
+        chunks = [b"first-chunk", b"x", b"second-chunk-" * 5]
+        path = tmp_path / "out.md"
+
+        _write_file(path, chunks)
+
+        assert path.read_bytes() == b"".join(chunks)
+
+    def test_batches_respect_iov_max(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        real_writev = os.writev
+        batch_sizes: List[int] = []
+
+        def recording_writev(fd: int, buffers: List[memoryview]) -> int:
+            batch_sizes.append(len(buffers))
+            return real_writev(fd, buffers)
+
+        monkeypatch.setattr(result_saver, '_IOV_MAX', 3)
+        monkeypatch.setattr(result_saver.os, 'writev', recording_writev)
+        chunks = [bytes([65 + i]) for i in range(10)]
+        path = tmp_path / "out.md"
+
+        _write_file(path, chunks)
+
+        assert path.read_bytes() == b"".join(chunks)
+        assert max(batch_sizes) <= 3
+
+    def test_streams_in_flush_size_batches(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(result_saver, '_FLUSH_SIZE', 100)
+        path = tmp_path / "out.md"
+        sizes_seen: List[int] = []
+
+        def chunks() -> Iterator[bytes]:
+            for _ in range(10):
+                # Размер файла в момент выдачи следующего фрагмента
+                sizes_seen.append(path.stat().st_size)
+                yield b"y" * 40
+
+        _write_file(path, chunks())
+
+        assert path.read_bytes() == b"y" * 400
+        # Фрагменты сбрасываются по мере накопления, а не в конце
+        assert sizes_seen == [0, 0, 0, 120, 120, 120, 240, 240, 240, 360]
+
+    def test_without_writev(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.delattr(result_saver.os, 'writev')
+        chunks = [b"abc", b"def" * 1000]
+        path = tmp_path / "out.md"
+
+        _write_file(path, chunks)
+
+        assert path.read_bytes() == b"".join(chunks)
@@ -0,0 +1,149 @@
+"""
+Компилирует YAML конфигурации агентов, задач и игровых входных данных
+в Python-модуль.
+
+Запуск из корня репозитория:
+
+    python tools/compile_configs.py
+
+Создает src/marketing_posts/config/_compiled.py с разобранными
+конфигурациями в виде литералов Python. ConfigManager берет словарь
+оттуда, если SHA-256 YAML файла совпадает с сохраненным, поэтому
+измененные, но не перекомпилированные файлы по-прежнему разбираются
+из YAML.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Any, List
+
+import yaml
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CONFIG_DIR = ROOT_DIR / "src" / "marketing_posts" / "config"
+OUTPUT_PATH = CONFIG_DIR / "_compiled.py"
+
+# Файл конфигурации -> имя константы в скомпилированном модуле
+CONFIG_FILES = {
+    "agents.yaml": "AGENTS_CONFIG",
+    "tasks.yaml": "TASKS_CONFIG",
+    "agents_gaming.yaml": "AGENTS_GAMING_CONFIG",
+    "tasks_gaming.yaml": "TASKS_GAMING_CONFIG",
+    "gaming_inputs.yaml": "GAMING_INPUTS_CONFIG",
+}
+
+HEADER = '''"""
+Скомпилированные YAML конфигурации.
+
+Сгенерировано tools/compile_configs.py - не редактируйте вручную.
+После изменения YAML файлов запустите скрипт снова.
+"""
+'''
+
+MAX_LINE_LENGTH = 79
+INDENT = "    "
+
+# Слово вместе с идущими за ним пробелами - единица переноса строк
+_WORD_RE = re.compile(r"\S*\s*")
+
+
+def _split_string(value: str, width: int) -> List[str]:
+    """
+    Разбивает строку на части, repr которых не длиннее width.
+    
+    Переносы выполняются только между словами; слово длиннее width
+    остается одной частью.
+    """
+    parts: List[str] = []
+    current = ""
+    for word in _WORD_RE.findall(value):
+        if current and len(repr(current + word)) > width:
+            parts.append(current)
+            current = word
+        else:
+            current += word
+    parts.append(current)
+    return parts
+
+
+def _format_value(value: Any, indent: str, column: int) -> str:
+    """
+    Форматирует значение как литерал Python с висячими отступами.
+    
+    Args:
+        value: Значение из разобранного YAML
+        indent: Отступ строки, в которой начинается литерал
+        column: Позиция, с которой литерал начинается в этой строке
+        
+    Returns:
+        Текст литерала; строки после первой уже содержат отступы
+    """
+    inner = indent + INDENT
+    if isinstance(value, (dict, list)) and value:
+        if isinstance(value, dict):
+            opening, closing = "{", "}"
+            heads = [f"{inner}{key!r}: " for key in value]
+            items = list(value.values())
+        else:
+            opening, closing = "[", "]"
+            heads = [inner] * len(value)
+            items = value
+        lines = [opening]
+        for head, item in zip(heads, items):
+            body = _format_value(item, inner, len(head))
+            lines.append(f"{head}{body},")
+        lines.append(indent + closing)
+        return "\n".join(lines)
+    
+    text = repr(value)
+    # +1 - запятая после элемента
+    if not isinstance(value, str) or (
+        column + len(text) + 1 <= MAX_LINE_LENGTH
+    ):
+        return text
+    
+    parts = _split_string(value, MAX_LINE_LENGTH - len(inner))
+    lines = ["("]
+    lines.extend(f"{inner}{part!r}" for part in parts)
+    lines.append(indent + ")")
+    return "\n".join(lines)
+
+
+def compile_configs() -> str:
+    """
+    Разбирает YAML файлы и возвращает исходный код модуля.
+    
+    Returns:
+        Текст модуля с константами конфигураций и индексом по SHA-256
+    """
+    lines: List[str] = [HEADER]
+    index: List[str] = []
+    
+    for file_name, const_name in CONFIG_FILES.items():
+        data = (CONFIG_DIR / file_name).read_bytes()
+        config = yaml.load(data, Loader=yaml.SafeLoader)
+        digest = hashlib.sha256(data).hexdigest()
+        
+        head = f"{const_name} = "
+        body = _format_value(config, "", len(head))
+        lines.append(f"\n# {file_name}")
+        lines.append(f"{head}{body}")
+        lines.append(f"{const_name}_SHA256 = (\n    '{digest}'\n)\n")
+        index.append(f"    {const_name}_SHA256: {const_name},")
+    
+    lines.append("\n# SHA-256 исходного YAML -> разобранная конфигурация")
+    lines.append("COMPILED_CONFIGS = {")
+    lines.extend(index)
+    lines.append("}\n")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Точка входа скрипта."""
+    OUTPUT_PATH.write_text(compile_configs(), encoding='utf-8')
+    print(f"✅ Конфигурации скомпилированы: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()